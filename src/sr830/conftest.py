@@ -0,0 +1,14 @@
+"""Pytest configuration for sr830 library tests connected to an instrument."""
+
+
+def pytest_addoption(parser):
+    """Add instrument connection options to the pytest command line."""
+    parser.addoption("--resource-name", help="VISA resource name")
+    parser.addoption(
+        "--output-interface",
+        type=int,
+        help=(
+            "Output communication interface for reading instrument responses: 0 "
+            + "(RS232) or 1 (GPIB)"
+        ),
+    )
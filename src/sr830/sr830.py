@@ -3,10 +3,14 @@
 The full instrument manual, including the programming guide, can be found at
 https://www.thinksrs.com/downloads/pdfs/manuals/SR830m.pdf.
 """
+import contextlib
 import logging
+import queue
+import threading
+import time
 import warnings
 
-import pyvisa
+import numpy as np
 
 
 logging.captureWarnings(True)
@@ -150,6 +154,14 @@ class sr830:
 
     # --- private class variables ---
 
+    # resource manager shared by all instances, created on first connection
+    _resource_manager = None
+
+    # locks serialising communication with instruments on the same bus, keyed by
+    # VISA interface, e.g. "GPIB0", so command sequences from different instances
+    # don't interleave
+    _bus_locks = {}
+
     _enable_register_cmd_dict = {
         "standard_event": "*ESE",
         "serial_poll": "*SRE",
@@ -157,6 +169,95 @@ class sr830:
         "lia_status": "LIAE",
     }
 
+    # enable register query commands
+    _enable_register_query_cmds = {
+        register: f"{cmd}?" for register, cmd in _enable_register_cmd_dict.items()
+    }
+
+    # enable register names listed in error messages
+    _enable_register_names = ", ".join(_enable_register_cmd_dict)
+
+    # valid enable register and status byte values and bit numbers
+    _register_values = range(256)
+    _register_bits = range(8)
+
+    # pre-encoded enable register set command prefixes
+    _enable_register_set_cmds = {
+        register: f"{cmd} ".encode()
+        for register, cmd in _enable_register_cmd_dict.items()
+    }
+
+    # compound command setting every enable register
+    _enable_all_cmd = ";".join(
+        f"{cmd} 255" for cmd in _enable_register_cmd_dict.values()
+    )
+
+    # pre-encoded command headers for setters called in tight loops
+    _aux_out_cmd_header = b"AUXV "
+
+    # pre-encoded templates for commands with only integer arguments
+    _display_cmd = b"DDEF %d,%d,%d"
+    _front_output_cmd = b"FPOP %d,%d"
+    _auto_offset_cmd = b"AOFF %d"
+    _save_setup_cmd = b"SSET %d"
+    _recall_setup_cmd = b"RSET %d"
+    _ascii_buffer_cmd = b"TRCA? %d,%d,%d"
+    _binary_buffer_cmd = b"TRCB? %d,%d,%d"
+    _non_norm_buffer_cmd = b"TRCL? %d,%d,%d"
+
+    # maximum length of a batched compound command, keeping it and its termination
+    # within the instrument's 256 character input queue
+    _max_batch_length = 250
+
+    # response terminators for the RS232 and GPIB output interfaces
+    _read_terminations = ("\r", "\n")
+
+    # query commands for frequently read values keyed by parameter/channel number,
+    # pre-encoded where they're sent with raw reads and writes
+    _measure_cmds = {p: f"OUTP? {p}".encode() for p in range(1, 5)}
+    _read_display_cmds = {ch: f"OUTR? {ch}".encode() for ch in range(1, 3)}
+    _aux_in_cmds = {aux_in: f"OAUX? {aux_in}".encode() for aux_in in range(1, 5)}
+    _aux_out_cmds = {aux_out: f"AUXV? {aux_out}".encode() for aux_out in range(1, 5)}
+    _display_cmds = {ch: f"DDEF? {ch}" for ch in range(1, 3)}
+
+    # pre-encoded set commands for integer settings keyed by command header then
+    # value, which also define the valid values
+    _setting_cmds = {
+        header: {value: f"{header} {value}".encode() for value in range(n)}
+        for header, n in [
+            ("FMOD", 2),
+            ("RSLP", 3),
+            ("ISRC", 4),
+            ("IGND", 2),
+            ("ICPL", 2),
+            ("ILIN", 4),
+            ("SENS", 27),
+            ("RMOD", 3),
+            ("OFLT", 20),
+            ("OFSL", 4),
+            ("SYNC", 2),
+            ("OUTX", 2),
+            ("KCLK", 2),
+            ("ALRM", 2),
+            ("SRAT", 15),
+            ("SEND", 2),
+            ("TSTR", 2),
+            ("FAST", 3),
+            ("LOCL", 3),
+            ("OVRM", 2),
+            ("*PSC", 2),
+        ]
+    }
+
+    # valid buffer start bins and bin counts, and setup save/recall numbers
+    _buffer_start_bins = range(16383)
+    _buffer_bins = range(1, 16384)
+    _setup_numbers = range(1, 10)
+
+    # valid SNAP? parameters and encoded parameter strings indexed by number
+    _snap_parameters = range(1, 12)
+    _snap_parameter_strs = tuple(str(i).encode() for i in range(12))
+
     _status_byte_cmd_dict = {
         "standard_event": "*ESR?",
         "serial_poll": "*STB?",
@@ -164,6 +265,14 @@ class sr830:
         "lia_status": "LIAS?",
     }
 
+    # status byte names listed in error messages
+    _status_byte_names = ", ".join(_status_byte_cmd_dict)
+
+    # pre-encoded status byte query commands
+    _status_byte_query_cmds = {
+        status_byte: cmd.encode() for status_byte, cmd in _status_byte_cmd_dict.items()
+    }
+
     # Meaning of status bits. Indices of outer list are same are bit numbers.
     # Indices of inner lists give description of event or state.
     _serial_poll_status_bit_names = [
@@ -208,6 +317,13 @@ class sr830:
         ["", "Power-on"],
     ]
 
+    # bits of the LIA status and standard event status bytes that indicate errors
+    _lia_status_error_mask = 0b00001111
+    _standard_event_error_mask = 0b00110101
+
+    # serial poll status bits summarising the status bytes checked for errors
+    _error_summary_bits = ((2, "error"), (3, "lia_status"), (5, "standard_event"))
+
     _lia_status_bit_names = [
         "INPUT/RESRV",
         "FILTR",
@@ -250,6 +366,46 @@ class sr830:
         ["", "Internal math error"],
     ]
 
+    def __init__(self, use_cache=False, cache_ttl=None):
+        """Initialise object.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            If `True`, instrument settings written or read by this object are cached
+            and subsequent reads of the same setting return the cached value instead
+            of querying the instrument. Only enable this if the settings cannot be
+            changed by other means, e.g. from the front panel, or set `cache_ttl`.
+            Use `invalidate_cache()` to force the next reads to query the instrument.
+            The reference phase and sine amplitude are cached when read but not when
+            written, because the instrument rounds the written values. The reference
+            frequency and harmonic are never cached because the instrument adjusts
+            them itself, e.g. when tracking an external reference or lowering the
+            harmonic as the frequency increases.
+            The output interface and end of buffer mode are remembered even if
+            `False` so buffer reads don't query them each time. Call
+            `invalidate_cache()` after changing them from the front panel.
+        cache_ttl : float or None, optional
+            Time in seconds after which a cached setting is read from the instrument
+            again, bounding how long a change made by other means can go unnoticed.
+            If `None`, cached settings never expire.
+        """
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._idn = None
+        # whether commands have been written since the last reset
+        self._modified = True
+        self._lock = threading.RLock()
+        self._batch = None
+        # whether batched writes of the same setting are coalesced
+        self._coalesce = False
+        # whether the serial poll status byte can be read with a GPIB serial poll
+        self._serial_poll = False
+        # output interface and end of buffer mode last written or read, if known
+        self._output_interface = None
+        self._end_of_buffer_mode = None
+
     def __enter__(self):
         """Enter the runtime context related to this object."""
         return self
@@ -258,11 +414,387 @@ class sr830:
         """Exit the runtime context related to this object."""
         self.disconnect()
 
+    def _query_setting(self, cmd, converter=int):
+        """Query an instrument setting, returning the cached value if available.
+
+        Parameters
+        ----------
+        cmd : str
+            Query command.
+        converter : callable, optional
+            Function used to convert the response string to the setting value.
+
+        Returns
+        -------
+        value
+            Setting value.
+        """
+        if (self.use_cache is True) and (cmd in self._cache):
+            value, timestamp = self._cache[cmd]
+            if (self.cache_ttl is None) or (
+                time.monotonic() - timestamp < self.cache_ttl
+            ):
+                return value
+
+        value = converter(self._query(cmd))
+        self._update_cache(cmd, value)
+        return value
+
+    def _write_setting(self, cmd, value):
+        """Write an instrument setting and update its cached value.
+
+        Parameters
+        ----------
+        cmd : str
+            Set command header in `_setting_cmds`, e.g. "SENS". The cache key is the
+            corresponding query command, e.g. "SENS?".
+        value : int
+            Setting value, which must be valid for the command.
+        """
+        new_cmd = self._setting_cmds[cmd][value]
+        with self._lock:
+            if self._coalesce is True:
+                # update an earlier batched write of the setting in place so it keeps
+                # its position relative to other commands, unless the longer value
+                # would overflow the input queue
+                header = f"{cmd} ".encode()
+                for i, old_cmd in enumerate(self._batch):
+                    if old_cmd.startswith(header):
+                        if self._batch_fits(new_cmd[len(old_cmd) :]):
+                            self._batch[i] = new_cmd
+                            new_cmd = None
+                        break
+            if new_cmd is not None:
+                self._write_raw(new_cmd)
+        self._update_cache(f"{cmd}?", value)
+
+    def _update_cache(self, cmd, value):
+        """Store a setting value in the cache if caching is enabled.
+
+        Parameters
+        ----------
+        cmd : str
+            Query command used to read the setting.
+        value
+            Setting value.
+        """
+        if self.use_cache is True:
+            self._cache[cmd] = (value, time.monotonic())
+
+    def _invalidate_settings(self, *cmds):
+        """Remove settings from the cache.
+
+        Parameters
+        ----------
+        cmds : str
+            Query commands used to read the settings.
+        """
+        for cmd in cmds:
+            self._cache.pop(cmd, None)
+
+    @classmethod
+    def _get_resource_manager(cls):
+        """Get the shared resource manager, creating it if required.
+
+        Opening a resource manager loads the VISA library, so this is only done once
+        per process rather than for every instrument connection.
+
+        Returns
+        -------
+        resource_manager : pyvisa.ResourceManager
+            Resource manager using the system set VISA backend.
+        """
+        if cls._resource_manager is None:
+            # import here so using the module's value tables doesn't load PyVISA
+            import pyvisa
+
+            cls._resource_manager = pyvisa.ResourceManager()
+        return cls._resource_manager
+
+    def _write(self, cmd):
+        """Write a command while holding the bus lock.
+
+        If writes are being batched, the command is added to the batch instead.
+
+        Parameters
+        ----------
+        cmd : str
+            Command without write termination.
+        """
+        self._write_raw(cmd.encode("ascii"))
+
+    def _flush_batch(self):
+        """Write any batched commands as a single compound command."""
+        if self._batch:
+            self._send(b";".join(self._batch))
+            self._batch.clear()
+
+    def _send(self, cmd):
+        """Write an encoded command with the resource's write termination.
+
+        Callers must hold the bus lock.
+
+        Parameters
+        ----------
+        cmd : bytes
+            Encoded command without write termination.
+        """
+        # gate debug logging so the message isn't built unless it will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Write: %r", cmd)
+        self.instr.write_raw(cmd + self.instr.write_termination.encode("ascii"))
+
+    def _send_query(self, cmd):
+        """Write a query, sending any batched commands in the same write.
+
+        The instrument executes the batched commands before the query and only the
+        query produces a response, so this saves a bus transaction. Callers must
+        hold the bus lock.
+
+        Parameters
+        ----------
+        cmd : bytes
+            Encoded query command without write termination.
+        """
+        if self._batch:
+            if self._batch_fits(cmd):
+                self._batch.append(cmd)
+                cmd = b";".join(self._batch)
+                self._batch.clear()
+            else:
+                self._flush_batch()
+        self._send(cmd)
+
+    def _query(self, cmd):
+        """Query the instrument while holding the bus lock.
+
+        Parameters
+        ----------
+        cmd : str
+            Query command without write termination.
+
+        Returns
+        -------
+        response : str
+            Response with read termination removed.
+        """
+        with self._lock:
+            self._flush_batch()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Query: %r", cmd)
+            return self.instr.query(cmd)
+
+    def _write_raw(self, cmd):
+        """Write a pre-encoded command, skipping PyVISA's string encoding.
+
+        If writes are being batched, the command is added to the batch instead.
+
+        Parameters
+        ----------
+        cmd : bytes
+            Encoded command without write termination.
+        """
+        with self._lock:
+            self._modified = True
+            if self._batch is None:
+                self._send(cmd)
+            else:
+                if not self._batch_fits(cmd):
+                    self._flush_batch()
+                self._batch.append(cmd)
+
+    def _batch_fits(self, cmd):
+        """Check whether a command can be added to the batch.
+
+        Parameters
+        ----------
+        cmd : bytes
+            Encoded command without write termination.
+
+        Returns
+        -------
+        fits : bool
+            Whether the compound command including `cmd` fits in the instrument's
+            input queue.
+        """
+        return sum(map(len, self._batch)) + len(self._batch) + len(cmd) <= (
+            self._max_batch_length
+        )
+
+    def _query_raw(self, cmd, size=None):
+        """Query using a pre-encoded command, skipping PyVISA's string handling.
+
+        Intended for numeric responses, which can be converted directly from bytes.
+
+        Parameters
+        ----------
+        cmd : bytes
+            Encoded command without write termination.
+        size : int or None, optional
+            Number of bytes to request per low-level read. If `None`, use the
+            resource chunk size.
+
+        Returns
+        -------
+        response : bytes
+            Raw response, including any termination characters.
+        """
+        with self._lock:
+            self._send_query(cmd)
+            return self.instr.read_raw(size)
+
+    @contextlib.contextmanager
+    def _binary_transfer(self):
+        """Disable termination character detection during a binary transfer.
+
+        Binary data can contain bytes equal to the termination character, which would
+        otherwise end each low-level read early and split the transfer into many
+        reads. Over GPIB reads still end on the END signal sent with the last byte.
+        Serial reads have no end signal, so the caller must request exactly the
+        number of bytes sent. The previous settings are restored afterwards.
+        """
+        read_termination = self.instr.read_termination
+        if not read_termination:
+            # termination character detection already disabled
+            yield
+            return
+
+        import pyvisa
+
+        # serial resources also end reads on the termination character
+        end_input = getattr(self.instr, "end_input", None)
+        self.instr.read_termination = None
+        if end_input is not None:
+            self.instr.end_input = pyvisa.constants.SerialTermination.none
+        try:
+            yield
+        finally:
+            self.instr.read_termination = read_termination
+            if end_input is not None:
+                self.instr.end_input = end_input
+
+    @contextlib.contextmanager
+    def _loop_storage_paused(self):
+        """Pause data storage during a buffer read if in loop mode.
+
+        Storage is restarted afterwards. In 1 Shot mode nothing is written, so only
+        the buffer query itself is sent. The bus lock is held throughout so the
+        pause, read, and restart aren't interleaved with commands from other
+        instances.
+
+        Yields
+        ------
+        prefix : bytes
+            Command prefix to send with the buffer query, pausing storage in the
+            same write if in loop mode.
+        """
+        with self._lock:
+            # use the mode last written or read to avoid a query per buffer read
+            if (end_of_buffer_mode := self._end_of_buffer_mode) is None:
+                end_of_buffer_mode = self.end_of_buffer_mode
+            if end_of_buffer_mode == 1:
+                try:
+                    yield b"PAUS;"
+                finally:
+                    # restart loop storage, skipping the setter's validation
+                    self._write_setting("SEND", 1)
+            else:
+                yield b""
+
+    def _query_binary_buffer(self, cmd, datatype, bins, expect_termination):
+        """Query a binary buffer transfer, retrying with smaller reads on failure.
+
+        The instrument sends the values without a block header, so the number of
+        points must be given. The whole transfer is read in one chunk where
+        possible to avoid a VISA read call per default-sized chunk. If a read larger
+        than the resource chunk size fails, e.g. because a backend stalls on large
+        reads, the device is cleared and the transfer requested again with half the
+        data size per read, down to the resource chunk size and up to two times.
+        Other failures are raised immediately because a smaller read can't fix
+        them.
+
+        Parameters
+        ----------
+        cmd : bytes
+            Encoded buffer transfer query command.
+        datatype : {"f", "i"}
+            Format of each 4-byte point.
+        bins : int
+            Number of points to read.
+        expect_termination : bool
+            Whether the transfer is followed by termination characters.
+
+        Returns
+        -------
+        buffer : numpy.ndarray
+            Points read from the buffer.
+        """
+        from pyvisa.errors import VisaIOError
+
+        data_size = 4 * bins
+        if expect_termination is True:
+            # 4 bytes per point plus termination characters, the read ending early
+            # on the END signal
+            chunk_size = max(self.instr.chunk_size, data_size + 64)
+        else:
+            # without termination or END a serial read only returns once the
+            # requested number of bytes has arrived, so request exactly the data
+            chunk_size = data_size
+        retries = 2
+        while True:
+            try:
+                with self._binary_transfer():
+                    self._send_query(cmd)
+                    if expect_termination is True:
+                        return self.instr.read_binary_values(
+                            datatype=datatype,
+                            is_big_endian=False,
+                            container=np.ndarray,
+                            header_fmt="empty",
+                            expect_termination=expect_termination,
+                            data_points=bins,
+                            chunk_size=chunk_size,
+                        )
+                    else:
+                        # read_binary_values keeps reading after a read fills the
+                        # requested size, which times out without termination or
+                        # END, so read exactly the data bytes. Copy to a bytearray
+                        # so the array is writable.
+                        data = self.instr.read_bytes(data_size, chunk_size=chunk_size)
+                        return np.frombuffer(bytearray(data), dtype=f"<{datatype}4")
+            except VisaIOError as err:
+                if (retries == 0) or (chunk_size <= self.instr.chunk_size):
+                    raise
+
+                retries -= 1
+                # never request more than the data in one read
+                chunk_size = max(min(chunk_size, data_size) // 2, self.instr.chunk_size)
+                warnings.warn(
+                    f"Buffer transfer failed: {err}. Retrying with chunk size "
+                    + f"{chunk_size}."
+                )
+                self.instr.clear()
+
+    def _wait_for_command_completion(self):
+        """Wait until the instrument has finished executing commands.
+
+        Polls the IFC bit of the serial poll status byte, which is set when no
+        command execution is in progress. On GPIB this is a serial poll, which the
+        instrument's interface answers without queueing a command behind the one
+        being executed. The delay between polls doubles after each poll, up to a
+        maximum of 0.1 s, so short operations return quickly without flooding the
+        bus during long ones.
+        """
+        delay = 0.001
+        while not self._read_serial_poll() & (1 << 1):
+            time.sleep(delay)
+            delay = min(2 * delay, 0.1)
+
     def connect(
         self,
         resource_name,
         resource_manager=None,
-        output_interface=0,
+        output_interface=None,
         reset=True,
         local_lockout=True,
         **resource_kwargs,
@@ -280,15 +812,17 @@ class sr830:
             https://pyvisa.readthedocs.io/en/latest/introduction/names.html for more
             info on correct formatting for resource names.
         resource_manager : visa.ResourceManager, optional
-            Resource manager used to create new connection. If `None`, create a new
-            resource manager using system set VISA backend.
-        output_interface : {0, 1}, optional
+            Resource manager used to create new connection. If `None`, use a resource
+            manager shared by all instances, which is created using the system set
+            VISA backend the first time it's needed.
+        output_interface : {None, 0, 1}, optional
             Communication interface on the lock-in amplifier rear panel used to read
-            instrument responses. Default it RS232. Although the SR830 can read
-            commands from both interfaces at any time, it can only send responses over
-            one. This does not need to match the VISA resource interface type if, for
-            example, an interface adapter is used between the control computer and the
-            instrument. Valid output communication interfaces:
+            instrument responses. Although the SR830 can read commands from both
+            interfaces at any time, it can only send responses over one. This does not
+            need to match the VISA resource interface type if, for example, an
+            interface adapter is used between the control computer and the
+            instrument. If `None`, GPIB is used for GPIB resources and RS232 for all
+            other resources. Valid output communication interfaces:
 
                 * 0 : RS232
                 * 1 : GPIB
@@ -303,33 +837,149 @@ class sr830:
             Keyword arguments passed to PyVISA resource to be used to change
             instrument attributes after construction.
         """
+        # share a lock with other instances connected through the same interface
+        interface = resource_name.split("::")[0].upper()
+        self._lock = self._bus_locks.setdefault(interface, threading.RLock())
+
         if resource_manager is None:
-            # create new resource manager using system setting for visa lib
-            resource_manager = pyvisa.ResourceManager()
+            resource_manager = self._get_resource_manager()
         self.instr = resource_manager.open_resource(resource_name, **resource_kwargs)
+        self.invalidate_cache()
+        self._idn = None
+        self._modified = True
+
+        import pyvisa
+
+        self._serial_poll = (
+            self.instr.interface_type == pyvisa.constants.InterfaceType.gpib
+        )
 
         if reset is True:
             self.reset()
 
-        self.output_interface = output_interface
+        if output_interface is None:
+            # direct responses to the interface the resource is connected through so
+            # queries don't time out
+            if self._serial_poll is True:
+                output_interface = 1
+            else:
+                output_interface = 0
 
-        self.enable_all_status_bytes()
+        # send the initial configuration in one transaction
+        with self.batched():
+            self.output_interface = output_interface
 
-        if local_lockout is True:
-            self.local_mode = 2
-        else:
-            self.local_mode = 1
+            self.enable_all_status_bytes()
+
+            if local_lockout is True:
+                self.local_mode = 2
+            else:
+                self.local_mode = 1
 
     def disconnect(self):
         """Disconnect the instrument after returning to local mode."""
         self.local_mode = 0
         self.instr.close()
 
+    def invalidate_cache(self):
+        """Clear all cached instrument settings.
+
+        Subsequent reads of settings query the instrument.
+        """
+        self._cache.clear()
+        self._output_interface = None
+        self._end_of_buffer_mode = None
+
+    @contextlib.contextmanager
+    def batched(self, coalesce=False):
+        """Combine writes into a single compound command.
+
+        Within the context, commands written by setters are collected instead of
+        being sent individually. They are written as one semicolon separated command
+        when the context exits, or before the next query, so only one bus transaction
+        is needed for a group of settings. Batches too long for the instrument's
+        input queue are split over several writes. Other instances on the same bus
+        can't communicate until the context exits.
+
+        Parameters
+        ----------
+        coalesce : bool, optional
+            If `True`, only the last value written to each integer setting, e.g.
+            sensitivity, since the batch was last sent is kept. It is written at the
+            position of the first write of the setting so the order of commands is
+            unchanged, and the instrument doesn't process values that are
+            immediately replaced. Other commands are always kept. Ignored if already
+            batching.
+
+        Examples
+        --------
+        >>> with lia.batched():
+        ...     lia.sensitivity = 20
+        ...     lia.time_constant = 8
+        """
+        with self._lock:
+            if self._batch is not None:
+                # already batching
+                yield
+                return
+
+            self._batch = []
+            self._coalesce = coalesce
+            try:
+                yield
+            finally:
+                try:
+                    self._flush_batch()
+                finally:
+                    self._batch = None
+                    self._coalesce = False
+
+    def configure(self, **settings):
+        """Apply several settings in a single compound command.
+
+        Parameters
+        ----------
+        **settings
+            Settable property names and values, e.g. `sensitivity=20`. Values are
+            validated by the property setters.
+
+        Examples
+        --------
+        >>> lia.configure(sensitivity=20, time_constant=8, lowpass_filter_slope=3)
+        """
+        for name in settings:
+            prop = getattr(type(self), name, None)
+            if not isinstance(prop, property) or prop.fset is None:
+                raise ValueError(f"Invalid setting: {name}.")
+
+        with self.batched():
+            for name, value in settings.items():
+                setattr(self, name, value)
+
     def enable_all_status_bytes(self):
         """Enable all status bytes."""
-        registers = ["standard_event", "serial_poll", "error", "lia_status"]
-        for register in registers:
-            self.set_enable_register(register, 255, decimal=True)
+        self._write(self._enable_all_cmd)
+        for register in self._enable_register_cmd_dict:
+            self._update_enable_register_cache(register, 255)
+
+    def _update_enable_register_cache(self, register, value=None):
+        """Update the cached values of an enable register after it's written.
+
+        Cached values of the whole register and its individual bits are removed.
+
+        Parameters
+        ----------
+        register : {"standard_event", "serial_poll", "error", "lia_status"}
+            Enable register that was written.
+        value : int or None, optional
+            New value of the whole register. If `None`, e.g. after setting a single
+            bit, the register is read from the instrument when next required.
+        """
+        query = self._enable_register_query_cmds[register]
+        stale = [cmd for cmd in self._cache if cmd.startswith(query)]
+        self._invalidate_settings(*stale)
+        if value is not None:
+            self._update_cache(query, value)
 
     @property
     def errors(self):
@@ -340,39 +990,44 @@ class sr830:
         errors : list
             List of errors.
         """
-        sp = self.get_status_byte("serial_poll")
-        sp = format(sp, "b")
+        sp = self._read_serial_poll()
         errors = []
+        # local binding for use in the loops below
+        append = errors.append
 
         # check if the interface output buffer is non-empty
-        if sp[4] == "1":
-            errors.append(self._serial_poll_status_byte[4][1])
+        if sp & (1 << 4):
+            append(self._serial_poll_status_byte[4][1])
+
+        # read all status bytes flagged in the serial poll status byte with a single
+        # compound query
+        flagged = [
+            status_byte
+            for bit, status_byte in self._error_summary_bits
+            if sp & (1 << bit)
+        ]
+        status_byte_values = dict(zip(flagged, self._get_status_bytes(*flagged)))
 
         # if any bits in error status byte are enabled check if they constitute an error
-        if sp[2] == "1":
-            esb = self.get_status_byte("error")
-            esb = format(esb, "b")
-            for i, bit in enumerate(esb):
-                if bit == "1":
-                    errors.append(self._error_status_byte[i][1])
+        if "error" in status_byte_values:
+            esb = status_byte_values["error"]
+            for i in self._set_bits(esb):
+                if message := self._error_status_byte[i][1]:
+                    append(message)
 
         # if any bits in LIA status byte are enabled check if they constitute an error
-        if sp[3] == "1":
-            lsb = self.get_status_byte("lia_status")
-            lsb = format(lsb, "b")
-            for i, bit in enumerate(lsb[:4]):
-                if bit == "1":
-                    errors.append(self._lia_status_byte[i][1])
+        if "lia_status" in status_byte_values:
+            lsb = status_byte_values["lia_status"] & self._lia_status_error_mask
+            for i in self._set_bits(lsb):
+                append(self._lia_status_byte[i][1])
 
         # if any bits in standard event status byte are enabled check if they
         # constitute an error
-        if sp[5] == "1":
-            sesb = self.get_status_byte("standard_event")
-            sesb = format(sesb, "b")
-            sesb_error_bits = [0, 2, 4, 5]
-            for i in sesb_error_bits:
-                if sesb[i] == "1":
-                    errors.append(self._standard_event_status_byte[i][1])
+        if "standard_event" in status_byte_values:
+            sesb = status_byte_values["standard_event"]
+            sesb &= self._standard_event_error_mask
+            for i in self._set_bits(sesb):
+                append(self._standard_event_status_byte[i][1])
 
         if len(errors) != 0:
             print(f"Instrument reported errors: {', '.join(errors)}.")
@@ -380,6 +1035,27 @@ class sr830:
 
         return errors
 
+    @staticmethod
+    def _set_bits(value):
+        """Yield the indices of the set bits in a status byte value, lowest first.
+
+        Only set bits are visited, so a clear byte costs nothing to decode.
+
+        Parameters
+        ----------
+        value : int
+            Status byte value.
+
+        Yields
+        ------
+        i : int
+            Index of a set bit.
+        """
+        while value:
+            lowest = value & -value
+            yield lowest.bit_length() - 1
+            value ^= lowest
+
     # --- Reference and phase commands ---
     @property
     def reference_phase_shift(self):
@@ -390,7 +1066,7 @@ class sr830:
         phase_shift : float
             Phase shift in degrees, -360 =< phase_shift =< 720.
         """
-        return float(self.instr.query("PHAS?"))
+        return self._query_setting("PHAS?", float)
 
     @reference_phase_shift.setter
     def reference_phase_shift(self, phase_shift):
@@ -401,8 +1077,10 @@ class sr830:
         phase_shift : float
             Phase shift in degrees, -360 =< phase_shift =< 720.
         """
-        if (phase_shift >= -360) and (phase_shift <= 720):
-            self.instr.write(f"PHAS {phase_shift}")
+        if -360 <= phase_shift <= 720:
+            self._write(f"PHAS {phase_shift}")
+            # the instrument rounds the value so read it back when next required
+            self._invalidate_settings("PHAS?")
         else:
             raise ValueError(
                 f"Invalid phase shift: {phase_shift}. Must be in range -360 - 720 "
@@ -421,7 +1099,7 @@ class sr830:
                 * 0 : external
                 * 1 : internal
         """
-        return int(self.instr.query("FMOD?"))
+        return self._query_setting("FMOD?")
 
     @reference_source.setter
     def reference_source(self, source):
@@ -435,8 +1113,8 @@ class sr830:
                 * 0 : external
                 * 1 : internal
         """
-        if source in [0, 1]:
-            self.instr.write(f"FMOD {source}")
+        if source in self._setting_cmds["FMOD"]:
+            self._write_setting("FMOD", source)
         else:
             raise ValueError(
                 f"Invalid reference source: {source}. Must be 0 (external) or 1 "
@@ -452,7 +1130,7 @@ class sr830:
         freq : float
             Frequency in Hz, 0.001 =< freq =< 102000.
         """
-        return float(self.instr.query("FREQ?"))
+        return float(self._query_raw(b"FREQ?"))
 
     @reference_frequency.setter
     def reference_frequency(self, freq):
@@ -463,8 +1141,10 @@ class sr830:
         freq : float
             Frequency in Hz, 0.001 =< freq =< 102000.
         """
-        if (freq >= 0.001) and (freq <= 102000):
-            self.instr.write(f"FREQ {freq}")
+        if 0.001 <= freq <= 102000:
+            self._write(f"FREQ {freq}")
+            # the time constant can change with the detection frequency range
+            self._invalidate_settings("OFLT?")
         else:
             raise ValueError(
                 f"Invalid reference frequency: {freq}. Must be in range 0.001 - 102000 "
@@ -484,7 +1164,7 @@ class sr830:
                 * 1: TTL rising egde
                 * 2: TTL falling edge
         """
-        return int(self.instr.query("RSLP?"))
+        return self._query_setting("RSLP?")
 
     @reference_trigger.setter
     def reference_trigger(self, trigger):
@@ -499,8 +1179,8 @@ class sr830:
                 * 1: TTL rising egde
                 * 2: TTL falling edge
         """
-        if trigger in [0, 1, 2]:
-            self.instr.write(f"RSLP {trigger}")
+        if trigger in self._setting_cmds["RSLP"]:
+            self._write_setting("RSLP", trigger)
         else:
             raise ValueError(
                 f"Invalid trigger type: {trigger}. Must be 0 (zero crossing), 1 "
@@ -516,7 +1196,7 @@ class sr830:
         harmonic : int
             detection harmonic, 1 =< harmonic =< 19999
         """
-        return int(self.instr.query("HARM?"))
+        return int(self._query("HARM?"))
 
     @harmonic.setter
     def harmonic(self, harmonic):
@@ -527,8 +1207,10 @@ class sr830:
         harmonic : int
             Detection harmonic, 1 =< harmonic =< 19999.
         """
-        if (harmonic >= 1) and (harmonic <= 19999):
-            self.instr.write(f"HARM {harmonic}")
+        if 1 <= harmonic <= 19999:
+            self._write(f"HARM {harmonic}")
+            # the time constant can change with the detection frequency range
+            self._invalidate_settings("OFLT?")
         else:
             raise ValueError(
                 f"Invalid detection harmonic: {harmonic}. Must be in range 1 - 19999."
@@ -543,7 +1225,7 @@ class sr830:
         amplitude : float
             sine amplitude in volts, 0.004 =< amplitude =< 5.000
         """
-        return float(self.instr.query("SLVL?"))
+        return self._query_setting("SLVL?", float)
 
     @sine_amplitude.setter
     def sine_amplitude(self, amplitude):
@@ -554,8 +1236,10 @@ class sr830:
         amplitude : float
             sine amplitude in volts, 0.004 =< amplitude =< 5.000
         """
-        if (amplitude >= 0.004) and (amplitude <= 5):
-            self.instr.write(f"SLVL {amplitude}")
+        if 0.004 <= amplitude <= 5:
+            self._write(f"SLVL {amplitude}")
+            # the instrument rounds the value so read it back when next required
+            self._invalidate_settings("SLVL?")
         else:
             raise ValueError(
                 f"Invalid sine output amplitude: {amplitude}. Must be in range 0.004 -"
@@ -576,7 +1260,7 @@ class sr830:
                 * 2 : I (1 MOhm)
                 * 3 : I (100 MOhm)
         """
-        return int(self.instr.query("ISRC?"))
+        return self._query_setting("ISRC?")
 
     @input_configuration.setter
     def input_configuration(self, config):
@@ -592,8 +1276,8 @@ class sr830:
                 * 2 : I (1 MOhm)
                 * 3 : I (100 MOhm)
         """
-        if config in range(4):
-            self.instr.write(f"ISRC {config}")
+        if config in self._setting_cmds["ISRC"]:
+            self._write_setting("ISRC", config)
         else:
             raise ValueError(
                 f"Invalid input configuration: {config}. Must be 0 (A), 1 (A-B), 2 "
@@ -612,7 +1296,7 @@ class sr830:
                 * 0 : Float
                 * 1 : Ground
         """
-        return int(self.instr.query("IGND?"))
+        return self._query_setting("IGND?")
 
     @input_shield_grounding.setter
     def input_shield_grounding(self, grounding):
@@ -626,8 +1310,8 @@ class sr830:
                 * 0 : Float
                 * 1 : Ground
         """
-        if grounding in [0, 1]:
-            self.instr.write(f"IGND {grounding}")
+        if grounding in self._setting_cmds["IGND"]:
+            self._write_setting("IGND", grounding)
         else:
             raise ValueError(
                 f"Invalid input shield grounding: {grounding}. Must be 0 (float) or 1"
@@ -646,7 +1330,7 @@ class sr830:
                 * 0 : AC
                 * 1 : DC
         """
-        return int(self.instr.query("ICPL?"))
+        return self._query_setting("ICPL?")
 
     @input_coupling.setter
     def input_coupling(self, coupling):
@@ -660,8 +1344,8 @@ class sr830:
                 * 0 : AC
                 * 1 : DC
         """
-        if coupling in [0, 1]:
-            self.instr.write(f"ICPL {coupling}")
+        if coupling in self._setting_cmds["ICPL"]:
+            self._write_setting("ICPL", coupling)
         else:
             raise ValueError(
                 f"Invalid input coupling: {coupling}. Must be 0 (AC) or 1 (DC)."
@@ -681,7 +1365,7 @@ class sr830:
                 * 2 : 2 x Line notch in
                 * 3 : Both notch filters in
         """
-        return int(self.instr.query("ILIN?"))
+        return self._query_setting("ILIN?")
 
     @line_notch_filter_status.setter
     def line_notch_filter_status(self, status):
@@ -697,8 +1381,8 @@ class sr830:
                 * 2 : 2 x Line notch in
                 * 3 : Both notch filters in
         """
-        if status in range(4):
-            self.instr.write(f"ILIN {status}")
+        if status in self._setting_cmds["ILIN"]:
+            self._write_setting("ILIN", status)
         else:
             raise ValueError(
                 f"Invalid line notch filter status: {status}. Must be 0 (no filters), "
@@ -745,7 +1429,7 @@ class sr830:
                 * 25 : 500e-3
                 * 26 : 1
         """
-        return int(self.instr.query("SENS?"))
+        return self._query_setting("SENS?")
 
     @sensitivity.setter
     def sensitivity(self, sensitivity):
@@ -784,8 +1468,8 @@ class sr830:
                 * 25 : 500e-3
                 * 26 : 1
         """
-        if sensitivity in range(27):
-            self.instr.write(f"SENS {sensitivity}")
+        if sensitivity in self._setting_cmds["SENS"]:
+            self._write_setting("SENS", sensitivity)
         else:
             raise ValueError(
                 f"Invalid sensitivity: {sensitivity}. Must be an integer in range 0 - "
@@ -805,7 +1489,7 @@ class sr830:
                 * 1 : Normal
                 * 2 : Low noise
         """
-        return int(self.instr.query("RMOD?"))
+        return self._query_setting("RMOD?")
 
     @reserve_mode.setter
     def reserve_mode(self, mode):
@@ -820,8 +1504,10 @@ class sr830:
                 * 1 : Normal
                 * 2 : Low noise
         """
-        if mode in range(3):
-            self.instr.write(f"RMOD {mode}")
+        if mode in self._setting_cmds["RMOD"]:
+            self._write_setting("RMOD", mode)
+            # the time constant can change with the reserve mode
+            self._invalidate_settings("OFLT?")
         else:
             raise ValueError(
                 f"Invalid reserve mode: {mode}. Must be 0 (high), 1 (normal), or 2 "
@@ -858,7 +1544,7 @@ class sr830:
                 * 18 : 10e3
                 * 19 : 30e3
         """
-        return int(self.instr.query("OFLT?"))
+        return self._query_setting("OFLT?")
 
     @time_constant.setter
     def time_constant(self, tc):
@@ -890,8 +1576,8 @@ class sr830:
                 * 18 : 10e3
                 * 19 : 30e3
         """
-        if tc in range(20):
-            self.instr.write(f"OFLT {tc}")
+        if tc in self._setting_cmds["OFLT"]:
+            self._write_setting("OFLT", tc)
         else:
             raise ValueError(
                 f"Invalid time constant: {tc}. Must be an integer in range 0 - 19."
@@ -911,7 +1597,7 @@ class sr830:
                 * 2 : 18
                 * 3 : 24
         """
-        return int(self.instr.query("OFSL?"))
+        return self._query_setting("OFSL?")
 
     @lowpass_filter_slope.setter
     def lowpass_filter_slope(self, slope):
@@ -927,8 +1613,10 @@ class sr830:
                 * 2 : 18
                 * 3 : 24
         """
-        if slope in range(4):
-            self.instr.write(f"OFSL {slope}")
+        if slope in self._setting_cmds["OFSL"]:
+            self._write_setting("OFSL", slope)
+            # the time constant can change with the filter slope
+            self._invalidate_settings("OFLT?")
         else:
             raise ValueError(
                 f"Invalid low-pass filter slope: {slope}. Must be 0 (6 dB/oct), 1 "
@@ -947,7 +1635,7 @@ class sr830:
                 * 0 : Off
                 * 1 : below 200 Hz
         """
-        return int(self.instr.query("SYNC?"))
+        return self._query_setting("SYNC?")
 
     @sync_filter_status.setter
     def sync_filter_status(self, status):
@@ -961,8 +1649,8 @@ class sr830:
                 * 0 : Off
                 * 1 : below 200 Hz
         """
-        if status in [0, 1]:
-            self.instr.write(f"SYNC {status}")
+        if status in self._setting_cmds["SYNC"]:
+            self._write_setting("SYNC", status)
         else:
             raise ValueError(
                 f"Invalid synchronous filter status: {status}. Must be 0 (off) or 1 "
@@ -983,7 +1671,8 @@ class sr830:
                 * 0 : RS232
                 * 1 : GPIB
         """
-        return int(self.instr.query("OUTX?"))
+        self._output_interface = self._query_setting("OUTX?")
+        return self._output_interface
 
     @output_interface.setter
     def output_interface(self, interface):
@@ -1000,11 +1689,14 @@ class sr830:
                 * 0 : RS232
                 * 1 : GPIB
         """
-        if interface in [0, 1]:
-            if interface == 0:
-                # set read terminator for RS232
-                self.instr.read_termination = "\r"
-            self.instr.write(f"OUTX {interface}")
+        if interface in self._setting_cmds["OUTX"]:
+            # match the read terminator to the interface's response terminator so
+            # reads end on it, only updating the resource if it has changed
+            read_termination = self._read_terminations[interface]
+            if self.instr.read_termination != read_termination:
+                self.instr.read_termination = read_termination
+            self._write_setting("OUTX", interface)
+            self._output_interface = interface
         else:
             raise ValueError(
                 f"Invalid output interface: {interface}. Must be 0 (RS232) or 1 "
@@ -1053,7 +1745,8 @@ class sr830:
                 * 2 : Aux In 4
         """
         if (channel in [1, 2]) and (display in range(5)) and (ratio in range(3)):
-            self.instr.write(f"DDEF {channel}, {display}, {ratio}")
+            self._write_raw(self._display_cmd % (channel, display, ratio))
+            self._update_cache(f"DDEF? {channel}", (display, ratio))
         else:
             raise ValueError(
                 f"Invalid channel, display, or ratio: {channel}, {display}, or {ratio}"
@@ -1104,11 +1797,16 @@ class sr830:
                 * 1 : Aux In 2
                 * 2 : Aux In 4
         """
-        if channel in [1, 2]:
-            display, ratio = self.instr.write(f"DDEF? {channel}").split(",")
-            return int(display), int(ratio)
+        if channel in self._display_cmds:
+            return self._query_setting(self._display_cmds[channel], self._parse_display)
         else:
-            raise ValueError(f"Invalid channel: {channel}. Must be 0 (Ch1) or 1 (Ch2).")
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
+
+    @staticmethod
+    def _parse_display(resp):
+        """Parse a display configuration response into (display, ratio) integers."""
+        display, ratio = resp.split(",", 1)
+        return int(display), int(ratio)
 
     def set_front_output(self, channel, output=0):
         """Set front panel output sources.
@@ -1133,7 +1831,8 @@ class sr830:
                 * 1 : Y
         """
         if (channel in [1, 2]) and (output in [0, 1]):
-            self.instr.write(f"FPOP {channel}, {output}")
+            self._write_raw(self._front_output_cmd % (channel, output))
+            self._update_cache(f"FPOP? {channel}", output)
         else:
             raise ValueError(
                 f"Invalid channel or output: {channel} or {output}. Channel must be 0 "
@@ -1165,9 +1864,9 @@ class sr830:
                 * 1 : Y
         """
         if channel in [1, 2]:
-            return int(self.instr.query(f"FPOP? {channel}"))
+            return self._query_setting(f"FPOP? {channel}")
         else:
-            raise ValueError(f"Invalid channel: {channel}. Must be 0 (Ch1) or 1 (Ch2).")
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
 
     def set_output_offset_expand(self, parameter, offset, expand):
         """Set the output offsets and expands.
@@ -1198,7 +1897,10 @@ class sr830:
             and (offset <= 105)
             and (expand in range(3))
         ):
-            self.instr.write(f"OEXP {parameter}, {offset}, {expand}")
+            self._write(f"OEXP {parameter}, {offset}, {expand}")
+            # the offset is rounded by the instrument and the time constant can
+            # change with the expand
+            self._invalidate_settings(f"OEXP? {parameter}", "OFLT?")
         else:
             raise ValueError(
                 f"Invalid parameter, offset, or expand: {parameter}, {offset}, or "
@@ -1230,9 +1932,11 @@ class sr830:
                 * 1 : 10
                 * 2 : 100
         """
-        if parameter in range(3):
-            offset, expand = self.instr.query(f"OEXP? {parameter}").split(",")
-            return float(offset), int(expand)
+        if parameter in [1, 2, 3]:
+            return self._query_setting(
+                f"OEXP? {parameter}",
+                lambda resp: tuple(t(i) for t, i in zip((float, int), resp.split(","))),
+            )
         else:
             raise ValueError(
                 f"Invalid paramter: {parameter}. Must be 1 (X), 2 (Y), or 3 (R)."
@@ -1250,8 +1954,9 @@ class sr830:
                 * 2 : Y
                 * 3 : R
         """
-        if parameter in range(3):
-            self.instr.write(f"AOFF {parameter}")
+        if parameter in [1, 2, 3]:
+            self._write_raw(self._auto_offset_cmd % parameter)
+            self._invalidate_settings(f"OEXP? {parameter}")
         else:
             raise ValueError(
                 f"Invalid paramter: {parameter}. Must be 1 (X), 2 (Y), or 3 (R)."
@@ -1274,8 +1979,8 @@ class sr830:
         voltage : float
             Auxiliary input voltage.
         """
-        if aux_in in [1, 2, 3, 4]:
-            return float(self.instr.query(f"OAUX? {aux_in}"))
+        if aux_in in self._aux_in_cmds:
+            return float(self._query_raw(self._aux_in_cmds[aux_in]))
         else:
             raise ValueError(
                 f"Invalid auxilliary input: {aux_in}. Must be an integer in range "
@@ -1292,8 +1997,8 @@ class sr830:
         voltage : float
             Output voltage, -10.500 =< voltage =< 10.500
         """
-        if (aux_out in [1, 2, 3, 4]) and (voltage >= -10.5) and (voltage <= 10.5):
-            self.instr.write(f"AUXV {aux_out}, {voltage}")
+        if (aux_out in self._aux_out_cmds) and (-10.5 <= voltage <= 10.5):
+            self._write_raw(self._aux_out_cmd_header + f"{aux_out},{voltage}".encode())
         else:
             raise ValueError(
                 f"Invalid auxilliary output or voltage: {aux_out} or {voltage}. Aux "
@@ -1314,8 +2019,8 @@ class sr830:
         voltage : float
             Output voltage, -10.500 =< voltage =< 10.500
         """
-        if aux_out in [1, 2, 3, 4]:
-            return float(self.instr.query(f"AUXV? {aux_out}"))
+        if aux_out in self._aux_out_cmds:
+            return float(self._query_raw(self._aux_out_cmds[aux_out]))
         else:
             raise ValueError(
                 f"Invalid auxilliary output: {aux_out}. Must be an integer in range "
@@ -1336,7 +2041,7 @@ class sr830:
                 * 0 : Off
                 * 1 : On
         """
-        return int(self.instr.query("KCLK?"))
+        return self._query_setting("KCLK?")
 
     @key_click_state.setter
     def key_click_state(self, state):
@@ -1350,8 +2055,8 @@ class sr830:
                 * 0 : Off
                 * 1 : On
         """
-        if state in [0, 1]:
-            self.instr.write(f"KCLK {state}")
+        if state in self._setting_cmds["KCLK"]:
+            self._write_setting("KCLK", state)
         else:
             raise ValueError(
                 f"Invalid key click state: {state}. Must be 0 (off) or 1 (on)."
@@ -1371,7 +2076,7 @@ class sr830:
                 * 0 : Off
                 * 1 : On
         """
-        return int(self.instr.query("ALRM?"))
+        return self._query_setting("ALRM?")
 
     @alarm_status.setter
     def alarm_status(self, status):
@@ -1387,8 +2092,8 @@ class sr830:
                 * 0 : Off
                 * 1 : On
         """
-        if status in [0, 1]:
-            self.instr.write(f"ALRM {status}")
+        if status in self._setting_cmds["ALRM"]:
+            self._write_setting("ALRM", status)
         else:
             raise ValueError(
                 f"Invalid alarm status: {status}. Must be 0 (off) or 1 (on)."
@@ -1402,8 +2107,8 @@ class sr830:
         number : {1 - 9}
             Buffer number, 1 =< number =< 9.
         """
-        if number in range(1, 10):
-            self.instr.write(f"SSET {number}")
+        if number in self._setup_numbers:
+            self._write_raw(self._save_setup_cmd % number)
         else:
             raise ValueError(
                 f"Invalid save buffer number: {number}. Must be an integer in range "
@@ -1418,8 +2123,9 @@ class sr830:
         number : {1 - 9}
             Buffer number, 1 =< number =< 9.
         """
-        if number in range(1, 10):
-            self.instr.write(f"RSET {number}")
+        if number in self._setup_numbers:
+            self._write_raw(self._recall_setup_cmd % number)
+            self.invalidate_cache()
         else:
             raise ValueError(
                 f"Invalid save buffer number: {number}. Must be an integer in range "
@@ -1431,17 +2137,30 @@ class sr830:
     def auto_gain(self):
         """Automatically set the gain.
 
-        Does nothing if the time constant is greater than 1 second.
+        Does nothing if the time constant is greater than 1 second. Returns when the
+        instrument has finished adjusting the gain.
         """
-        self.instr.write("AGAN")
+        self._write("AGAN")
+        self._invalidate_settings("SENS?")
+        self._wait_for_command_completion()
 
     def auto_reserve(self):
-        """Automatically set reserve."""
-        self.instr.write("ARSV")
+        """Automatically set reserve.
+
+        Returns when the instrument has finished adjusting the reserve.
+        """
+        self._write("ARSV")
+        self._invalidate_settings("RMOD?", "OFLT?")
+        self._wait_for_command_completion()
 
     def auto_phase(self):
-        """Automatically set phase."""
-        self.instr.write("APHS")
+        """Automatically set phase.
+
+        Returns when the instrument has finished adjusting the phase.
+        """
+        self._write("APHS")
+        self._invalidate_settings("PHAS?")
+        self._wait_for_command_completion()
 
     # --- Data storage commands ---
 
@@ -1470,7 +2189,7 @@ class sr830:
                 * 13 : 512
                 * 14 : Trigger
         """
-        return int(self.instr.query("SRAT?"))
+        return self._query_setting("SRAT?")
 
     @sample_rate.setter
     def sample_rate(self, rate):
@@ -1497,8 +2216,8 @@ class sr830:
                 * 13 : 512
                 * 14 : Trigger
         """
-        if rate in range(15):
-            self.instr.write(f"SRAT {rate}")
+        if rate in self._setting_cmds["SRAT"]:
+            self._write_setting("SRAT", rate)
         else:
             raise ValueError(
                 f"Invalid sample rate: {rate}. Must be an integer in range 0 - 14."
@@ -1510,13 +2229,14 @@ class sr830:
 
         Returns
         ----------
-        mode : {0, 1} or str
+        mode : {0, 1}
             End of buffer mode:
 
                 * 0 : 1 Shot
                 * 1 : Loop
         """
-        return int(self.instr.query("SEND?"))
+        self._end_of_buffer_mode = self._query_setting("SEND?")
+        return self._end_of_buffer_mode
 
     @end_of_buffer_mode.setter
     def end_of_buffer_mode(self, mode):
@@ -1533,8 +2253,9 @@ class sr830:
                 * 0 : 1 Shot
                 * 1 : Loop
         """
-        if mode in [0, 1]:
-            self.instr.write(f"SEND {mode}")
+        if mode in self._setting_cmds["SEND"]:
+            self._write_setting("SEND", mode)
+            self._end_of_buffer_mode = mode
         else:
             raise ValueError(
                 f"Invalid end of buffer mode: {mode}. Must be 0 (1 shot) or 1 (loop)."
@@ -1542,7 +2263,7 @@ class sr830:
 
     def trigger(self):
         """Send software trigger."""
-        self.instr.write("TRIG")
+        self._write("TRIG")
 
     @property
     def trigger_start_mode(self):
@@ -1550,13 +2271,13 @@ class sr830:
 
         Returns
         -------
-        mode : {0, 1} or str
+        mode : {0, 1}
             Trigger start mode:
 
                 * 0 : Off
                 * 1 : Start scan
         """
-        return int(self.instr.query("TSTR?"))
+        return self._query_setting("TSTR?")
 
     @trigger_start_mode.setter
     def trigger_start_mode(self, mode):
@@ -1570,8 +2291,8 @@ class sr830:
                 * 0 : Off
                 * 1 : Start scan
         """
-        if mode in [0, 1]:
-            self.instr.write(f"TSTR {mode}")
+        if mode in self._setting_cmds["TSTR"]:
+            self._write_setting("TSTR", mode)
         else:
             raise ValueError(
                 f"Invalid trigger start mode: {mode}. Must be 0 (off) or 1 "
@@ -1584,34 +2305,40 @@ class sr830:
         Ignored if storage already in progress.
 
         After turning on fast data transfer, this function starts the scan after a
-        delay of 0.5 sec.
+        delay of 0.5 sec. The delay is applied by the instrument so the controlling
+        interface has time to start reading before the first points are sent, so
+        start reading immediately after calling this function rather than waiting.
         """
         if self.data_transfer_mode == 0:
             # fast data transfer off
-            self.instr.write("STRT")
+            self._write("STRT")
         else:
             # fast data transfer mode active
-            self.instr.write("STRD")
+            self._write("STRD")
 
     def pause(self):
         """Pause data storage.
 
         Ignored if storage is already paused or reset.
         """
-        self.instr.write("PAUS")
+        self._write("PAUS")
 
     def reset_data_buffers(self):
         """Reset data buffers.
 
         This command will erase the data buffer.
         """
-        self.instr.write("REST")
+        self._write("REST")
 
     # --- Data transfer commands ---
 
     def measure(self, parameter):
         """Read the value of X, Y, R, or phase.
 
+        Each call is a separate bus transaction. To read more than one value use
+        `measure_xy()`, `measure_rphi()`, or `measure_multiple()` instead, which read
+        all values in a single transaction at the same instant.
+
         Parameters
         ----------
         parameter : {1, 2, 3, 4}
@@ -1627,14 +2354,46 @@ class sr830:
         value : float
             Value of measured parameter in volts or degrees.
         """
-        if parameter in range(1, 5):
-            return float(self.instr.query(f"OUTP? {parameter}"))
+        if parameter in self._measure_cmds:
+            return float(self._query_raw(self._measure_cmds[parameter]))
         else:
             raise ValueError(
                 f"Invalid parameter: {parameter}. Must be 1 (X), 2 (Y), 3 (R), or 4 "
                 + "(phase)."
             )
 
+    def measure_xy(self):
+        """Read the values of X and Y simultaneously.
+
+        Both values are recorded at a single instant and read in a single bus
+        transaction.
+
+        Returns
+        -------
+        x : float
+            Value of X in volts.
+        y : float
+            Value of Y in volts.
+        """
+        x, y = self._query_raw(b"SNAP? 1,2").split(b",")
+        return float(x), float(y)
+
+    def measure_rphi(self):
+        """Read the values of R and phase simultaneously.
+
+        Both values are recorded at a single instant and read in a single bus
+        transaction.
+
+        Returns
+        -------
+        r : float
+            Value of R in volts.
+        phase : float
+            Value of phase in degrees.
+        """
+        r, phase = self._query_raw(b"SNAP? 3,4").split(b",")
+        return float(r), float(phase)
+
     def read_display(self, channel):
         """Read the value of a channel display.
 
@@ -1651,12 +2410,12 @@ class sr830:
         value : float
             Displayed value in display units.
         """
-        if channel in [1, 2]:
-            return float(self.instr.query(f"OUTR? {channel}"))
+        if channel in self._read_display_cmds:
+            return float(self._query_raw(self._read_display_cmds[channel]))
         else:
-            raise ValueError(f"Invalid channel: {channel}. Must be 0 (Ch1) or 1 (Ch2).")
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
 
-    def measure_multiple(self, parameters):
+    def measure_multiple(self, parameters, as_tuple=False):
         """Read multiple (2-6) parameter values simultaneously.
 
         The values of X and Y are recorded at a single instant.
@@ -1688,17 +2447,27 @@ class sr830:
                 * 10 : CH1 display
                 * 11 : CH2 display
 
+        as_tuple : bool, optional
+            If `True`, return the values as a tuple of float instead of an array.
+
         Returns
         -------
-        values : tuple of float
+        values : numpy.ndarray of float64 or tuple of float
             Values of measured parameters.
         """
-        if all(p in range(1, 12) for p in parameters) and (
-            len(parameters) in range(2, 7)
+        # check the length first so long or empty lists fail without checking items
+        if (2 <= len(parameters) <= 6) and all(
+            p in self._snap_parameters for p in parameters
         ):
-            parameters = ",".join([str(i) for i in parameters])
-            values = self.instr.query(f"SNAP? {parameters}").split(",")
-            return (float(i) for i in values)
+            parameters = b",".join(
+                map(self._snap_parameter_strs.__getitem__, parameters)
+            )
+            # parse the raw response bytes directly, which also ignores the trailing
+            # termination characters
+            values = np.fromstring(self._query_raw(b"SNAP? " + parameters), sep=",")
+            if as_tuple is True:
+                return tuple(values.tolist())
+            return values
         else:
             raise ValueError(
                 f"Invalid parameter list: {parameters}. All paramters must be integers"
@@ -1715,9 +2484,9 @@ class sr830:
         N : int
             Number of points in the buffer.
         """
-        return int(self.instr.query("SPTS?"))
+        return int(self._query_raw(b"SPTS?"))
 
-    def get_ascii_buffer_data(self, channel, start_bin, bins):
+    def get_ascii_buffer_data(self, channel, start_bin, bins, as_tuple=False):
         """Get the points stored in a channel buffer range.
 
         The values are returned as ASCII floating point numbers with
@@ -1738,37 +2507,42 @@ class sr830:
             Starting bin to read where 0 is oldest. Must be in range 0 - 16382.
         bins : int
             Number of bins to read. Must be in range 1 - 16383.
+        as_tuple : bool, optional
+            If `True`, return the data as a tuple of float instead of an array.
 
         Returns
         -------
-        buffer : tuple of float
+        buffer : numpy.ndarray of float32 or tuple of float
             Data stored in buffer range.
         """
         if (
-            (channel in range(3))
-            and (start_bin in range(16383))
-            and (bins in range(1, 16384))
+            (channel in [1, 2])
+            and (start_bin in self._buffer_start_bins)
+            and (bins in self._buffer_bins)
         ):
-            # pause storage if loop mode
-            buffer_mode = self.end_of_buffer_modes[self.end_of_buffer_mode]
-            if buffer_mode == "Loop":
-                self.pause()
-
-            buffer = self.instr.query_ascii_values(
-                f"TRCA? {channel},{start_bin},{bins}",
-                converter=lambda x: x,
-                container=list,
-            )
-
-            # can leave a newline char at end of array that needs to be removed
-            if (buffer[-1] == "\n") or (buffer[-1] == ""):
-                buffer.pop()
-            # convert to tuple
-            buffer = tuple([float(x) for x in buffer])
+            # pause storage during the read if in loop mode
+            with self._loop_storage_paused() as prefix:
+                # each value takes up to 16 characters so size the read to get the
+                # whole response in one low-level read
+                response = self._query_raw(
+                    prefix + self._ascii_buffer_cmd % (channel, start_bin, bins),
+                    max(self.instr.chunk_size, 16 * bins + 64),
+                )
 
-            # restart loop storage if previously set
-            if buffer_mode == "Loop":
-                self.end_of_buffer_mode = 1
+            # parse the raw comma separated response in a single pass without first
+            # decoding it to a string, after removing the trailing separator and
+            # termination. Points are stored in single precision so match the binary
+            # transfer dtype. This is done after restarting storage and releasing
+            # the bus.
+            buffer = np.fromstring(response.rstrip(b",\r\n"), dtype=np.float32, sep=",")
+            # a count would pad a short response rather than raising
+            if len(buffer) != bins:
+                raise ValueError(
+                    f"Invalid buffer response: expected {bins} points but received "
+                    + f"{len(buffer)}."
+                )
+            if as_tuple is True:
+                buffer = tuple(buffer.tolist())
 
             return buffer
         else:
@@ -1778,11 +2552,13 @@ class sr830:
                 + "range 0 - 16382; and bins must be in range 1 - 16383."
             )
 
-    def get_binary_buffer_data(self, channel, start_bin, bins):
+    def get_binary_buffer_data(self, channel, start_bin, bins, as_tuple=False):
         """Get the points stored in a channel buffer range.
 
-        The values are returned as IEEE format binary floating point
-        numbers with the units of the trace.
+        The values are transferred as IEEE format binary floating point
+        numbers with the units of the trace and read directly into a
+        single-precision NumPy array. The instrument sends the values
+        without a block header, so exactly `bins` values are read.
 
         Bins (or points) a labelled from 0 (oldest) to N-1 (newest)
         where N is the total number of bins.
@@ -1799,45 +2575,41 @@ class sr830:
             Starting bin to read where 0 is oldest. Must be in range 0 - 16382.
         bins : int
             Number of bins to read. Must be in range 1 - 16383.
+        as_tuple : bool, optional
+            If `True`, return the data as a tuple of float instead of an array.
 
         Returns
         -------
-        buffer : tuple of float
+        buffer : numpy.ndarray of float32 or tuple of float
             Data stored in buffer range.
         """
         if (
             (channel in [1, 2])
-            and (start_bin >= 0)
-            and (start_bin <= 16382)
-            and (bins >= 1)
-            and (bins <= 16383)
+            and (start_bin in self._buffer_start_bins)
+            and (bins in self._buffer_bins)
         ):
-            # determine how to read buffer over output interface
-            output_interface = self.output_interfaces[self.output_interface]
-            if output_interface == "RS232":
+            # determine how to read buffer over output interface, using the interface
+            # last written or read to avoid a query per call
+            if (output_interface := self._output_interface) is None:
+                output_interface = self.output_interface
+            if output_interface == 0:
                 expect_termination = False
                 warnings.warn(
-                    f"SRS recommends not using binary transfers over serial interfaces."
+                    "SRS recommends not using binary transfers over serial interfaces."
                 )
-            elif output_interface == "GPIB":
+            elif output_interface == 1:
                 expect_termination = True
 
-            # pause storage if loop mode
-            buffer_mode = self.end_of_buffer_modes[self.end_of_buffer_mode]
-            if buffer_mode == "Loop":
-                self.pause()
-
-            buffer = self.instr.query_binary_values(
-                f"TRCB? {channel},{start_bin},{bins}",
-                datatype="f",
-                container=tuple,
-                expect_termination=expect_termination,
-                data_points=bins,
-            )
-
-            # restart loop storage if previously set
-            if buffer_mode == "Loop":
-                self.end_of_buffer_mode = 1
+            # pause storage during the read if in loop mode
+            with self._loop_storage_paused() as prefix:
+                buffer = self._query_binary_buffer(
+                    prefix + self._binary_buffer_cmd % (channel, start_bin, bins),
+                    "f",
+                    bins,
+                    expect_termination,
+                )
+            if as_tuple is True:
+                buffer = tuple(buffer.tolist())
 
             return buffer
         else:
@@ -1847,19 +2619,19 @@ class sr830:
                 + "range 0 - 16382; and bins must be in range 1 - 16383."
             )
 
-    def get_non_norm_buffer_data(self, channel, start_bin, bins):
+    def get_non_norm_buffer_data(self, channel, start_bin, bins, as_tuple=False):
         """Get the points stored in a channel buffer range.
 
-        The values are returned as non-normalised floating point
-        numbers with the units of the trace.
+        The values are transferred as non-normalised floating point
+        numbers with the units of the trace and decoded into a
+        single-precision NumPy array.
 
         Bins (or points) a labelled from 0 (oldest) to N-1 (newest)
         where N is the total number of bins.
 
-        If data storage is set to Loop mode, make sure that
-        storage is paused before reading any data. This is because
-        the points are indexed relative to the most recent point
-        which is continually changing.
+        If data storage is set to Loop mode, storage is paused before
+        reading any data. This is because the points are indexed relative
+        to the most recent point which is continually changing.
 
         Parameters
         ----------
@@ -1869,54 +2641,53 @@ class sr830:
             Starting bin to read where 0 is oldest. Must be in range 0 - 16382.
         bins : int
             Number of bins to read. Must be in range 1 - 16383.
+        as_tuple : bool, optional
+            If `True`, return the data as a tuple of float instead of an array.
 
         Returns
         -------
-        buffer : tuple of float
+        buffer : numpy.ndarray of float32 or tuple of float
             Data stored in buffer range.
         """
         if (
             (channel in [1, 2])
-            and (start_bin >= 0)
-            and (start_bin <= 16382)
-            and (bins >= 1)
-            and (bins <= 16383)
+            and (start_bin in self._buffer_start_bins)
+            and (bins in self._buffer_bins)
         ):
-            output_interface = self.output_interfaces[self.output_interface]
-            if output_interface == "RS232":
+            # use the interface last written or read to avoid a query per call
+            if (output_interface := self._output_interface) is None:
+                output_interface = self.output_interface
+            if output_interface == 0:
                 expect_termination = False
                 warnings.warn(
-                    f"SRS recommends not using binary transfers over serial interfaces."
+                    "SRS recommends not using binary transfers over serial interfaces."
                 )
-            elif output_interface == "GPIB":
+            elif output_interface == 1:
                 expect_termination = True
 
-            # pause storage if loop mode
-            buffer_mode = self.end_of_buffer_modes[self.end_of_buffer_mode]
-            if buffer_mode == "Loop":
-                self.pause()
-
-            # Although each value requires 4 bytes to be represented, read bytes into
-            # array 2 at time for later formatting, i.e. datatype is 'h' (short). Also,
-            # therefore read twice as many 2-byte values as 4-byte bins.
-            buffer = self.instr.query_binary_values(
-                f"TRCL? {channel},{start_bin},{bins}",
-                datatype="h",
-                is_big_endian=False,
-                container=list,
-                expect_termination=expect_termination,
-                data_points=2 * bins,
-            )
-
-            # Convert raw byte array into array of floats using SR830 format
-            mantissa_buffer = buffer[::2]
-            exp_buffer = buffer[1::2]
-            buffer = [m * 2 ** (e - 124) for m, e in zip(mantissa_buffer, exp_buffer)]
-            buffer = tuple(buffer)
+            # pause storage during the read if in loop mode
+            with self._loop_storage_paused() as prefix:
+                # Each value is 4 bytes: a signed 16-bit mantissa followed by an
+                # 8-bit exponent offset by 124 and an unused byte. Read each value as
+                # a 32-bit int and unpack the fields.
+                buffer = self._query_binary_buffer(
+                    prefix + self._non_norm_buffer_cmd % (channel, start_bin, bins),
+                    "i",
+                    bins,
+                    expect_termination,
+                )
 
-            # restart loop storage if previously set
-            if buffer_mode == "Loop":
-                self.end_of_buffer_mode = 1
+            # value = mantissa * 2 ** (exponent - 124). Decoding a full buffer this
+            # way takes tens of microseconds, which is negligible compared to the
+            # transfer itself. Intermediate arrays are updated in place so only the
+            # mantissa and exponent arrays are allocated.
+            values = buffer.astype(np.int16).astype(np.float32)
+            exponents = buffer >> 16
+            exponents &= 0xFF
+            exponents -= 124
+            buffer = np.ldexp(values, exponents, out=values)
+            if as_tuple is True:
+                buffer = tuple(buffer.tolist())
 
             return buffer
         else:
@@ -1926,6 +2697,139 @@ class sr830:
                 + "range 0 - 16382; and bins must be in range 1 - 16383."
             )
 
+    def get_all_buffer_data(self, channel):
+        """Get all points stored in a channel buffer.
+
+        The number of stored points is read once and all of them are read in a
+        single binary transfer, which is much faster than reading a growing buffer
+        in many small ranges. The transfer is as for `get_binary_buffer_data()`.
+
+        Parameters
+        ----------
+        channel : {1, 2}
+            Channel 1 or 2.
+
+        Returns
+        -------
+        buffer : numpy.ndarray of float32
+            Data stored in the buffer, oldest first. Empty if no points are stored.
+        """
+        if channel in [1, 2]:
+            # hold the bus lock so no other commands are sent between the two reads
+            with self._lock:
+                bins = self.buffer_size
+                if bins == 0:
+                    return np.empty(0, dtype=np.float32)
+                return self.get_binary_buffer_data(channel, 0, bins)
+        else:
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
+
+    def stream_buffer(self, channel, chunk=1024, points=None):
+        """Yield channel buffer data in chunks while data storage is in progress.
+
+        A background thread polls the number of stored points and reads each
+        completed chunk using a binary transfer, so reading earlier data overlaps
+        with the instrument storing new data and with processing of the previous
+        chunk. At most two chunks are read ahead of the consumer; if it falls
+        behind, points accumulate in the instrument buffer and are read in larger
+        transfers. Storage should be started in 1 Shot end of buffer mode, e.g. with
+        `start()`, before iterating. Loop mode is not supported because points are
+        indexed relative to the most recent point.
+
+        The instrument must not be accessed from other code while the generator is
+        running. Streaming stops when `points` points have been read, the buffer is
+        full, or data storage stops and all stored points have been read.
+
+        Parameters
+        ----------
+        channel : {1, 2}
+            Channel 1 or 2.
+        chunk : int, optional
+            Number of points to read per transfer while storage is in progress.
+        points : int or None, optional
+            Total number of points to read. If `None`, read until the buffer is full
+            or storage stops.
+
+        Yields
+        ------
+        buffer : numpy.ndarray of float32
+            Chunk of data stored in the buffer.
+        """
+        if (channel in [1, 2]) and (chunk >= 1) and ((points is None) or (points >= 1)):
+            if self.end_of_buffer_mode == 1:
+                raise ValueError("Buffer streaming requires 1 Shot end of buffer mode.")
+
+            sample_rate = self.sample_rates[self.sample_rate]
+
+            max_points = 16383 if points is None else min(points, 16383)
+            # double buffer: one chunk being processed while the next is queued
+            chunks = queue.Queue(maxsize=2)
+            stop = threading.Event()
+            # maximum time the reader waits on a full queue before checking whether
+            # streaming has stopped
+            put_timeout = 0.1
+
+            def put(item):
+                """Queue an item unless streaming has been stopped."""
+                while not stop.is_set():
+                    try:
+                        chunks.put(item, timeout=put_timeout)
+                        return
+                    except queue.Full:
+                        pass
+
+            def read_chunks():
+                """Read completed chunks from the buffer into the queue."""
+                try:
+                    start_bin = 0
+                    while (not stop.is_set()) and (start_bin < max_points):
+                        # check scan status before counting points so no points
+                        # stored before the end of a scan are missed
+                        scanning = self.get_status_byte("serial_poll", bit=0) == 0
+                        stored = min(self.buffer_size, max_points)
+                        if (stored - start_bin >= chunk) or (
+                            (stored > start_bin)
+                            and ((not scanning) or (stored == max_points))
+                        ):
+                            put(
+                                self.get_binary_buffer_data(
+                                    channel, start_bin, stored - start_bin
+                                )
+                            )
+                            start_bin = stored
+                        elif not scanning:
+                            break
+                        elif sample_rate == "Trigger":
+                            stop.wait(0.1)
+                        else:
+                            # poll about when the rest of the next chunk, or of the
+                            # remaining points if fewer, should be stored
+                            points_due = min(chunk, max_points - start_bin) - (
+                                stored - start_bin
+                            )
+                            stop.wait(min(max(points_due / sample_rate, 0.01), 0.5))
+                except Exception as err:
+                    put(err)
+                finally:
+                    put(None)
+
+            reader = threading.Thread(target=read_chunks, daemon=True)
+            reader.start()
+            try:
+                while (buffer := chunks.get()) is not None:
+                    if isinstance(buffer, Exception):
+                        raise buffer
+                    yield buffer
+            finally:
+                stop.set()
+                reader.join()
+        else:
+            raise ValueError(
+                f"Invalid channel, chunk, or points: {channel}, {chunk}, or {points}. "
+                + "Channel must be 1 (Ch1) or 2 (Ch2); chunk must be at least 1; and "
+                + "points must be None or at least 1."
+            )
+
     @property
     def data_transfer_mode(self):
         """Get the data transfer mode.
@@ -1939,7 +2843,7 @@ class sr830:
                 * 1 : On (DOS)
                 * 2 : On (Windows)
         """
-        return int(self.instr.query("FAST?"))
+        return self._query_setting("FAST?")
 
     @data_transfer_mode.setter
     def data_transfer_mode(self, mode):
@@ -1956,8 +2860,8 @@ class sr830:
                 * 1 : On (DOS)
                 * 2 : On (Windows)
         """
-        if mode in range(3):
-            self.instr.write(f"FAST {mode}")
+        if mode in self._setting_cmds["FAST"]:
+            self._write_setting("FAST", mode)
         else:
             raise ValueError(
                 f"Invalid data transfer mode: {mode}. Must be 0 (off), 1 (on [DOS]), "
@@ -1966,9 +2870,20 @@ class sr830:
 
     # --- Interface commands ---
 
-    def reset(self):
-        """Reset the instrument to the default configuration."""
-        self.instr.write("*RST")
+    def reset(self, force=True):
+        """Reset the instrument to the default configuration.
+
+        Parameters
+        ----------
+        force : bool, optional
+            If `False`, only reset the instrument if commands have been written since
+            the last reset by this object. Changes made by other means, e.g. from the
+            front panel, aren't tracked so only use this if they can't happen.
+        """
+        if (force is True) or (self._modified is True):
+            self._write("*RST")
+            self.invalidate_cache()
+            self._modified = False
 
     @property
     def idn(self):
@@ -1976,15 +2891,17 @@ class sr830:
 
         The string is in the format "Stanford_Research_Systems,SR830,s/n00111,ver1.000",
         where, for example, the serial number is 00111 and the firmware version is
-        1.000.
+        1.000. The string is read once per connection.
 
         Returns
         -------
-        idn : list
-            List of identification strings consisting of manufacturer, model, serial
-            number, and firmware version number in order.
+        idn : str
+            Comma separated identification string consisting of manufacturer, model,
+            serial number, and firmware version number in order.
         """
-        return self.instr.query(f"*IDN?")
+        if self._idn is None:
+            self._idn = self._query("*IDN?")
+        return self._idn
 
     @property
     def local_mode(self):
@@ -1999,7 +2916,7 @@ class sr830:
                 * 1 : REMOTE
                 * 2 : LOCAL LOCKOUT
         """
-        return int(self.instr.query("LOCL?"))
+        return self._query_setting("LOCL?")
 
     @local_mode.setter
     def local_mode(self, mode):
@@ -2014,8 +2931,8 @@ class sr830:
                 * 1 : REMOTE
                 * 2 : LOCAL LOCKOUT
         """
-        if mode in range(3):
-            self.instr.write(f"LOCL {mode}")
+        if mode in self._setting_cmds["LOCL"]:
+            self._write_setting("LOCL", mode)
         else:
             raise ValueError(
                 f"Invalid local mode: {mode}. Must be 0 (local), 1 (remote), or 2 "
@@ -2037,7 +2954,7 @@ class sr830:
                 * 0 : No
                 * 1 : Yes
         """
-        return int(self.instr.write("OVRM?"))
+        return self._query_setting("OVRM?")
 
     @gpib_override_remote.setter
     def gpib_override_remote(self, condition):
@@ -2054,8 +2971,8 @@ class sr830:
                 * 0 : No
                 * 1 : Yes
         """
-        if condition in [0, 1]:
-            self.instr.write(f"OVRM {condition}")
+        if condition in self._setting_cmds["OVRM"]:
+            self._write_setting("OVRM", condition)
         else:
             raise ValueError(
                 f"Invalid GPIB override remote condition: {condition}. Must be 0 (no) "
@@ -2066,7 +2983,7 @@ class sr830:
 
     def clear_status_registers(self):
         """Clear all status registers."""
-        self.instr.write("*CLS")
+        self._write("*CLS")
 
     def set_enable_register(self, register, value, decimal=True, bit=None):
         """Set an enable register.
@@ -2084,27 +3001,31 @@ class sr830:
         bit : None or {0-7}, optional
             Specific bit to set with a binary value.
         """
-        if register in (registers := self._enable_register_cmd_dict.keys()):
+        # a single lookup both validates the register and gets its command
+        if (prefix := self._enable_register_set_cmds.get(register)) is not None:
             if decimal is True:
-                if (value >= 0) & (value <= 255):
-                    cmd = f"{self._enable_register_cmd_dict[register]} {value}"
+                if value in self._register_values:
+                    cmd = prefix + b"%d" % value
                 else:
                     raise ValueError(
                         f"Invalid value: {value}. Must be in range 0 - 255 if decimal."
                     )
             else:
-                if (bit >= 0) & (bit <= 7) & ((value == 0) or (value == 1)):
-                    cmd = f"{self._enable_register_cmd_dict[register]} {bit},{value}"
+                if (bit in self._register_bits) and (value in (0, 1)):
+                    cmd = prefix + b"%d,%d" % (bit, value)
                 else:
                     raise ValueError(
                         f"Invalud bit or value: {bit} or {value}. Bit must in range"
                         + " 0 - 7 and value must be 0 or 1 if value is not decimal."
                     )
-            self.instr.write(cmd)
+            self._write_raw(cmd)
+            self._update_enable_register_cache(
+                register, value if decimal is True else None
+            )
         else:
             raise ValueError(
                 f"Invalid register: {register}. Must be one of "
-                + f"{', '.join(list(registers))}."
+                + f"{self._enable_register_names}."
             )
 
     def get_enable_register(self, register, bit=None):
@@ -2122,21 +3043,19 @@ class sr830:
         value : int
             Register value.
         """
-        if register in (registers := self._enable_register_cmd_dict.keys()):
-            if bit is None:
-                cmd = f"{self._enable_register_cmd_dict[register]}?"
-            else:
-                if (bit >= 0) & (bit <= 7):
-                    cmd = f"{self._enable_register_cmd_dict[register]}? {bit}"
+        if (cmd := self._enable_register_query_cmds.get(register)) is not None:
+            if bit is not None:
+                if bit in self._register_bits:
+                    cmd += f" {bit}"
                 else:
                     raise ValueError(
                         f"{bit} is out of range. Bit must be in range 0-7 if specified."
                     )
-            return int(self.instr.query(cmd))
+            return self._query_setting(cmd)
         else:
             raise ValueError(
                 f"Invalid register: {register}. Must be one of "
-                + f"{', '.join(list(registers))}."
+                + f"{self._enable_register_names}."
             )
 
     def get_status_byte(self, status_byte, bit=None):
@@ -2156,23 +3075,109 @@ class sr830:
         value : int
             Status byte value.
         """
-        if status_byte in (status_bytes := self._status_byte_cmd_dict.keys()):
-            if bit is None:
-                cmd = f"{self._status_byte_cmd_dict[status_byte]}"
-            else:
-                if (bit >= 0) & (bit <= 7):
-                    cmd = f"{self._status_byte_cmd_dict[status_byte]} {bit}"
+        if (cmd := self._status_byte_query_cmds.get(status_byte)) is not None:
+            if bit is not None:
+                if bit in self._register_bits:
+                    cmd += b" %d" % bit
                 else:
                     raise ValueError(
                         f"{bit} is out of range. Bit must be in range 0-7 if specified."
                     )
-            return int(self.instr.query(cmd))
+            return int(self._query_raw(cmd))
         else:
             raise ValueError(
                 f"Invalid status byte: {status_byte}. Must be one of "
-                + f"{', '.join(list(status_bytes))}."
+                + f"{self._status_byte_names}."
             )
 
+    def status_snapshot(self):
+        """Get all status bytes with a single compound query.
+
+        Reading the standard event, error, and LIA status bytes clears them.
+
+        Returns
+        -------
+        status_bytes : dict of int
+            Status byte values keyed by "standard_event", "serial_poll", "error",
+            and "lia_status".
+        """
+        names = tuple(self._status_byte_cmd_dict)
+        return dict(zip(names, self._get_status_bytes(*names)))
+
+    def enable_register_snapshot(self):
+        """Get all enable registers with a single compound query.
+
+        The values read are stored in the settings cache if caching is enabled.
+
+        Returns
+        -------
+        enable_registers : dict of int
+            Enable register values keyed by "standard_event", "serial_poll", "error",
+            and "lia_status".
+        """
+        cmds = list(self._enable_register_query_cmds.values())
+        values = self._query_compound(cmds)
+        for cmd, value in zip(cmds, values):
+            self._update_cache(cmd, value)
+        return dict(zip(self._enable_register_query_cmds, values))
+
+    def _read_serial_poll(self):
+        """Read the serial poll status byte.
+
+        On GPIB the byte is read with a serial poll, which avoids sending a query and
+        parsing an ASCII response. Other interfaces use the `*STB?` query.
+
+        Returns
+        -------
+        value : int
+            Serial poll status byte value.
+        """
+        if self._serial_poll is True:
+            with self._lock:
+                self._flush_batch()
+                return self.instr.read_stb()
+        else:
+            return self.get_status_byte("serial_poll")
+
+    def _get_status_bytes(self, *status_bytes):
+        """Get several status bytes with a single compound query.
+
+        Parameters
+        ----------
+        status_bytes : {"standard_event", "serial_poll", "error", "lia_status"}
+            Status bytes to get.
+
+        Returns
+        -------
+        values : list of int
+            Status byte values in the order requested.
+        """
+        return self._query_compound(
+            [self._status_byte_cmd_dict[status_byte] for status_byte in status_bytes]
+        )
+
+    def _query_compound(self, cmds):
+        """Query several integer values with a single compound query.
+
+        Parameters
+        ----------
+        cmds : list of str
+            Query commands.
+
+        Returns
+        -------
+        values : list of int
+            Values in the order queried.
+        """
+        values = []
+        if len(cmds) != 0:
+            with self._lock:
+                self._send_query(";".join(cmds).encode())
+                # responses may be terminated individually or separated by semicolons
+                while len(values) < len(cmds):
+                    values.extend(int(value) for value in self.instr.read().split(";"))
+        return values
+
     @property
     def power_on_status_clear_bit(self):
         """Get the power-on status clear bit.
@@ -2182,7 +3187,7 @@ class sr830:
         value : int
             Power-on status clear bit value.
         """
-        return int(self.instr.query("*PSC?"))
+        return self._query_setting("*PSC?")
 
     @power_on_status_clear_bit.setter
     def power_on_status_clear_bit(self, value):
@@ -2196,8 +3201,8 @@ class sr830:
                 * 0 : Cleared, status enable registers maintain values at power down.
                 * 1 : Set, all status and enable registers are cleared on power up.
         """
-        if value in [0, 1]:
-            self.instr.write(f"*PSC {value}")
+        if value in self._setting_cmds["*PSC"]:
+            self._write_setting("*PSC", value)
         else:
             raise ValueError(
                 f"Invalid power on status clear bit: {value}. Must be 0 (cleared) or 1"
@@ -1,29 +1,13 @@
 """Unit tests for sr830 library connected to an instrument."""
-import argparse
 import math
 import random
 import time
 
 import numpy as np
 import pytest
-import visa
+import pyvisa
 import sr830
 
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    "-r", "--resource-name", help="VISA resource name",
-)
-parser.add_argument(
-    "-o",
-    "--output-interface",
-    type=int,
-    help=(
-        "Output communication interface for reading instrument responses: 0 (RS232) "
-        + "or 1 (GPIB)"
-    ),
-)
-args = parser.parse_args()
-
 lia = sr830.sr830()
 
 
@@ -55,7 +39,7 @@ def _float_property_test(min_value, max_value, lia_property):
 
     # try a new valid amp
     while True:
-        new_value = np.random.uniform(min_value, max_value, 1)
+        new_value = random.uniform(min_value, max_value)
         if new_value != old_value:
             break
     lia_property = new_value
@@ -70,11 +54,11 @@ def _float_property_test(min_value, max_value, lia_property):
         lia_property = new_value
 
 
-def test_connect():
+def test_connect(pytestconfig):
     """Test for successful connection with minimal setup."""
     lia.connect(
-        args.resource_name,
-        output_interface=args.output_interface,
+        pytestconfig.getoption("resource_name"),
+        output_interface=pytestconfig.getoption("output_interface"),
         reset=False,
         local_lockout=False,
     )
@@ -97,6 +81,20 @@ def test_get_enable_register():
     assert lia.get_enable_register("lia_status") == 0
 
 
+def test_enable_register_snapshot():
+    """Test all enable registers are read at once.
+
+    All should be disabled after a reset.
+    """
+    snapshot = lia.enable_register_snapshot()
+    assert snapshot == {
+        "standard_event": 0,
+        "serial_poll": 0,
+        "error": 0,
+        "lia_status": 0,
+    }
+
+
 def test_set_enable_register():
     """Test set enable register function."""
     registers = list(lia._enable_register_cmd_dict.keys())
@@ -142,11 +140,57 @@ def test_get_status_byte():
     assert type(lia.get_status_byte("lia_status")) is int
 
 
+def test_status_snapshot():
+    """Test all status bytes are read at once."""
+    snapshot = lia.status_snapshot()
+    assert set(snapshot) == {"standard_event", "serial_poll", "error", "lia_status"}
+    assert all(type(value) is int for value in snapshot.values())
+
+
 def test_errors():
     """Check errors property."""
     lia.errors
 
 
+def test_invalidate_cache():
+    """Test cached settings are read back and cleared."""
+    lia.use_cache = True
+    lia.invalidate_cache()
+
+    sensitivity = lia.sensitivity
+    assert lia._cache["SENS?"][0] == sensitivity
+    assert lia.sensitivity == sensitivity
+
+    lia.invalidate_cache()
+    assert "SENS?" not in lia._cache
+
+    lia.use_cache = False
+
+
+def test_batched():
+    """Test batched writes are applied."""
+    with lia.batched():
+        lia.sensitivity = 20
+        lia.time_constant = 8
+    assert lia.sensitivity == 20
+    assert lia.time_constant == 8
+
+    with lia.batched(coalesce=True):
+        lia.sensitivity = 10
+        lia.sensitivity = 12
+    assert lia.sensitivity == 12
+
+
+def test_configure():
+    """Test several settings are applied at once."""
+    lia.configure(sensitivity=18, time_constant=9)
+    assert lia.sensitivity == 18
+    assert lia.time_constant == 9
+
+    with pytest.raises(ValueError):
+        lia.configure(not_a_setting=0)
+
+
 def test_reference_phase_shift():
     """Test read/write of reference phase shift."""
     _float_property_test(-360, 720, lia.reference_phase_shift)
@@ -358,7 +402,7 @@ def test_set_output_offset_expand():
         # check write/read of all valid settings
         for new_expand in expand_settings:
             while True:
-                new_offset = np.random.uniform(min_offset, max_offset, 1)
+                new_offset = random.uniform(min_offset, max_offset)
                 if new_offset != old_offset:
                     break
             lia.set_output_offset_expand(parameter, new_offset, new_expand)
@@ -435,7 +479,7 @@ def test_set_aux_out():
         old_voltage = lia.get_aux_out(aux_out)
 
         while True:
-            new_voltage = np.random.uniform(min_voltage, max_voltage, 1)
+            new_voltage = random.uniform(min_voltage, max_voltage)
             if new_voltage != old_voltage:
                 break
         lia.set_aux_out(aux_out, new_voltage)
@@ -576,6 +620,22 @@ def test_measure():
         lia.measure(new_setting)
 
 
+def test_measure_xy():
+    """Test simultaneous X and Y measurement function."""
+    values = lia.measure_xy()
+    assert len(values) == 2
+    for value in values:
+        assert type(value) == float
+
+
+def test_measure_rphi():
+    """Test simultaneous R and phase measurement function."""
+    values = lia.measure_rphi()
+    assert len(values) == 2
+    for value in values:
+        assert type(value) == float
+
+
 def test_read_display():
     """Test read display function."""
     channels = range(1, 3)
@@ -599,6 +659,11 @@ def test_measure_multiple():
         test_parameters = random.sample(parameters, i)
         values = lia.measure_multiple(test_parameters)
         assert len(values) == len(test_parameters)
+        assert values.dtype == np.float64
+
+        values = lia.measure_multiple(test_parameters, as_tuple=True)
+        assert type(values) is tuple
+        assert len(values) == len(test_parameters)
         for value in values:
             assert type(value) == float
 
@@ -637,7 +702,7 @@ def test_buffer_size():
     lia.reset_data_buffers()
 
 
-def _get_buffer_data(function):
+def _get_buffer_data(function, dtype=float):
     """Get buffer data using specified function."""
     channels = range(1, 3)
     start_bins = range(16383)
@@ -663,7 +728,7 @@ def _get_buffer_data(function):
         buffer = function(channel, buffer_start_bin, buffer_bins)
         assert len(buffer) == buffer_bins
         for datum in buffer:
-            assert type(datum) is float
+            assert type(datum) is dtype
 
     # make sure invalid settings raise errors
     with pytest.raises(ValueError):
@@ -690,17 +755,87 @@ def _get_buffer_data(function):
 
 def test_get_ascii_buffer_data():
     """Test get ascii buffer data function."""
-    _get_buffer_data(lia.get_ascii_buffer_data)
+    _get_buffer_data(lia.get_ascii_buffer_data, np.float32)
 
 
 def test_get_binary_buffer_data():
     """Test get ascii buffer data function."""
-    _get_buffer_data(lia.get_binary_buffer_data)
+    _get_buffer_data(lia.get_binary_buffer_data, np.float32)
 
 
 def test_get_non_norm_buffer_data():
     """Test get ascii buffer data function."""
-    _get_buffer_data(lia.get_non_norm_buffer_data)
+    _get_buffer_data(lia.get_non_norm_buffer_data, np.float32)
+
+
+def test_get_buffer_data_as_tuple():
+    """Test buffer data can be returned as a tuple of float."""
+    lia.trigger_start_mode = 0
+    lia.end_of_buffer_mode = 0
+    lia.sample_rate = 13
+    lia.data_transfer_mode = 0
+    lia.reset_data_buffers()
+    lia.start()
+    time.sleep(0.5)
+    lia.pause()
+    bins = lia.buffer_size
+
+    for function in [
+        lia.get_ascii_buffer_data,
+        lia.get_binary_buffer_data,
+        lia.get_non_norm_buffer_data,
+    ]:
+        buffer = function(1, 0, bins, as_tuple=True)
+        assert type(buffer) is tuple
+        assert len(buffer) == bins
+        assert all(type(datum) is float for datum in buffer)
+
+    lia.reset_data_buffers()
+
+
+def test_get_all_buffer_data():
+    """Test reading the whole buffer at once."""
+    lia.trigger_start_mode = 0
+    lia.end_of_buffer_mode = 0
+    lia.sample_rate = 13
+    lia.data_transfer_mode = 0
+    lia.reset_data_buffers()
+    lia.start()
+    time.sleep(0.5)
+    lia.pause()
+
+    buffer = lia.get_all_buffer_data(1)
+    assert len(buffer) == lia.buffer_size
+    assert buffer.dtype == np.float32
+
+    with pytest.raises(ValueError):
+        lia.get_all_buffer_data(3)
+
+
+def test_stream_buffer():
+    """Test streaming buffer data during storage."""
+    points = 256
+
+    lia.trigger_start_mode = 0
+    lia.end_of_buffer_mode = 0
+    lia.sample_rate = 13
+    lia.data_transfer_mode = 0
+    lia.reset_data_buffers()
+    lia.start()
+
+    buffer = np.concatenate(list(lia.stream_buffer(1, chunk=64, points=points)))
+    assert len(buffer) == points
+    assert buffer.dtype == np.float32
+
+    lia.pause()
+
+    # make sure invalid settings raise errors
+    with pytest.raises(ValueError):
+        next(lia.stream_buffer(3))
+    with pytest.raises(ValueError):
+        next(lia.stream_buffer(1, chunk=0))
+
+    lia.reset_data_buffers()
 
 
 def test_idn():
@@ -740,5 +875,5 @@ def test_power_on_status_clear_bit():
 def test_disconnect():
     """Test for successful disconnection."""
     lia.disconnect()
-    with pytest.raises(visa.InvalidSession):
+    with pytest.raises(pyvisa.InvalidSession):
         lia.instr.session
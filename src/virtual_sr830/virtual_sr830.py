@@ -3,8 +3,11 @@
 The full instrument manual, including the programming guide, can be found at
 https://www.thinksrs.com/downloads/pdfs/manuals/SR830m.pdf.
 """
+import contextlib
 import warnings
 
+import numpy as np
+
 
 class sr830:
     """Virtual Stanford Research Systems SR830 LIA instrument."""
@@ -237,8 +240,24 @@ class sr830:
         ["", "Internal math error"],
     ]
 
-    def __init__(self):
-        """Initialise dummy properties."""
+    def __init__(self, use_cache=False, cache_ttl=None):
+        """Initialise dummy properties.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            If `True`, instrument settings written or read by this object are cached
+            and subsequent reads of the same setting return the cached value instead
+            of querying the instrument. Only enable this if the settings cannot be
+            changed by other means, e.g. from the front panel, or set `cache_ttl`.
+            Use `invalidate_cache()` to force the next reads to query the instrument.
+        cache_ttl : float or None, optional
+            Time in seconds after which a cached setting is read from the instrument
+            again, bounding how long a change made by other means can go unnoticed.
+            If `None`, cached settings never expire.
+        """
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
         self._set_dummy_properties()
 
     def __enter__(self):
@@ -268,22 +287,17 @@ class sr830:
         self._lowpass_filter_slope = 1
         self._sync_filter_status = 0
         self._output_interface = 0
-        self._ch1_display = 0
-        self._ch1_ratio = 0
-        self._ch2_display = 0
-        self._ch2_ratio = 0
-        self._ch1_output = 0
-        self._ch2_output = 0
-        self._X_offset = 0
-        self._X_expand = 0
-        self._Y_offset = 0
-        self._Y_expand = 0
-        self._R_offset = 0
-        self._R_expand = 0
-        self._aux_out_1 = 0
-        self._aux_out_2 = 0
-        self._aux_out_3 = 0
-        self._aux_out_4 = 0
+        # per-channel/parameter/output settings keyed by the instrument index
+        self._displays = {1: (0, 0), 2: (0, 0)}
+        self._front_outputs = {1: 0, 2: 0}
+        self._output_offset_expands = {1: (0, 0), 2: (0, 0), 3: (0, 0)}
+        self._aux_outs = {1: 0, 2: 0, 3: 0, 4: 0}
+        self._enable_registers = {
+            "standard_event": 0,
+            "serial_poll": 0,
+            "error": 0,
+            "lia_status": 0,
+        }
         self._key_click_state = 0
         self._alarm_status = 0
         self._sample_rate = 13
@@ -300,7 +314,7 @@ class sr830:
         self,
         resource_name,
         resource_manager=None,
-        output_interface=0,
+        output_interface=None,
         reset=True,
         local_lockout=True,
         **resource_kwargs,
@@ -318,15 +332,17 @@ class sr830:
             https://pyvisa.readthedocs.io/en/latest/introduction/names.html for more
             info on correct formatting for resource names.
         resource_manager : visa.ResourceManager, optional
-            Resource manager used to create new connection. If `None`, create a new
-            resource manager using system set VISA backend.
-        output_interface : {0, 1}, optional
+            Resource manager used to create new connection. If `None`, use a resource
+            manager shared by all instances, which is created using the system set
+            VISA backend the first time it's needed.
+        output_interface : {None, 0, 1}, optional
             Communication interface on the lock-in amplifier rear panel used to read
-            instrument responses. Default it RS232. Although the SR830 can read
-            commands from both interfaces at any time, it can only send responses over
-            one. This does not need to match the VISA resource interface type if, for
-            example, an interface adapter is used between the control computer and the
-            instrument. Valid output communication interfaces:
+            instrument responses. Although the SR830 can read commands from both
+            interfaces at any time, it can only send responses over one. This does not
+            need to match the VISA resource interface type if, for example, an
+            interface adapter is used between the control computer and the
+            instrument. If `None`, GPIB is used for GPIB resources and RS232 for all
+            other resources. Valid output communication interfaces:
 
                 * 0 : RS232
                 * 1 : GPIB
@@ -341,6 +357,8 @@ class sr830:
             Keyword arguments passed to PyVISA resource to be used to change
             instrument attributes after construction.
         """
+        if output_interface is None:
+            output_interface = 0
         self.output_interface = output_interface
 
         if local_lockout is True:
@@ -352,9 +370,68 @@ class sr830:
         """Disconnect the instrument after returning to local mode."""
         pass
 
+    def invalidate_cache(self):
+        """Clear all cached instrument settings.
+
+        Subsequent reads of settings query the instrument.
+        """
+        pass
+
+    @contextlib.contextmanager
+    def batched(self, coalesce=False):
+        """Combine writes into a single compound command.
+
+        Within the context, commands written by setters are collected instead of
+        being sent individually. They are written as one semicolon separated command
+        when the context exits, or before the next query, so only one bus transaction
+        is needed for a group of settings. Batches too long for the instrument's
+        input queue are split over several writes. Other instances on the same bus
+        can't communicate until the context exits.
+
+        Parameters
+        ----------
+        coalesce : bool, optional
+            If `True`, only the last value written to each integer setting, e.g.
+            sensitivity, since the batch was last sent is kept. It is written at the
+            position of the first write of the setting so the order of commands is
+            unchanged, and the instrument doesn't process values that are
+            immediately replaced. Other commands are always kept. Ignored if already
+            batching.
+
+        Examples
+        --------
+        >>> with lia.batched():
+        ...     lia.sensitivity = 20
+        ...     lia.time_constant = 8
+        """
+        yield
+
+    def configure(self, **settings):
+        """Apply several settings in a single compound command.
+
+        Parameters
+        ----------
+        **settings
+            Settable property names and values, e.g. `sensitivity=20`. Values are
+            validated by the property setters.
+
+        Examples
+        --------
+        >>> lia.configure(sensitivity=20, time_constant=8, lowpass_filter_slope=3)
+        """
+        for name in settings:
+            prop = getattr(type(self), name, None)
+            if not isinstance(prop, property) or prop.fset is None:
+                raise ValueError(f"Invalid setting: {name}.")
+
+        with self.batched():
+            for name, value in settings.items():
+                setattr(self, name, value)
+
     def enable_all_status_bytes(self):
         """Enable all status bytes."""
-        pass
+        for register in self._enable_registers:
+            self._enable_registers[register] = 255
 
     @property
     def errors(self):
@@ -1037,12 +1114,7 @@ class sr830:
                 * 2 : Aux In 4
         """
         if (channel in [1, 2]) and (display in range(5)) and (ratio in range(3)):
-            if channel == 1:
-                self._ch1_display = display
-                self._ch1_ratio = ratio
-            elif channel == 2:
-                self._ch2_display = display
-                self._ch2_ratio = ratio
+            self._displays[channel] = (display, ratio)
         else:
             raise ValueError(
                 f"Invalid channel, display, or ratio: {channel}, {display}, or {ratio}"
@@ -1093,12 +1165,10 @@ class sr830:
                 * 1 : Aux In 2
                 * 2 : Aux In 4
         """
-        if channel == 1:
-            return self._ch1_display, self._ch1_ratio
-        elif channel == 2:
-            return self._ch2_display, self._ch2_ratio
+        if channel in self._displays:
+            return self._displays[channel]
         else:
-            raise ValueError(f"Invalid channel: {channel}. Must be 0 (Ch1) or 1 (Ch2).")
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
 
     def set_front_output(self, channel, output=0):
         """Set front panel output sources.
@@ -1123,10 +1193,7 @@ class sr830:
                 * 1 : Y
         """
         if (channel in [1, 2]) and (output in [0, 1]):
-            if channel == 1:
-                self._ch1_output = output
-            elif channel == 2:
-                self._ch2_output = output
+            self._front_outputs[channel] = output
         else:
             raise ValueError(
                 f"Invalid channel or output: {channel} or {output}. Channel must be 0 "
@@ -1157,12 +1224,10 @@ class sr830:
                 * 0 : CH2 display
                 * 1 : Y
         """
-        if channel == 1:
-            return self._ch1_output
-        elif channel == 2:
-            return self._ch2_output
+        if channel in self._front_outputs:
+            return self._front_outputs[channel]
         else:
-            raise ValueError(f"Invalid channel: {channel}. Must be 0 (Ch1) or 1 (Ch2).")
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
 
     def set_output_offset_expand(self, parameter, offset, expand):
         """Set the output offsets and expands.
@@ -1193,15 +1258,7 @@ class sr830:
             and (offset <= 105)
             and (expand in range(3))
         ):
-            if parameter == 1:
-                self._X_offset = offset
-                self._X_expand = expand
-            elif parameter == 2:
-                self._Y_offset = offset
-                self._Y_expand = expand
-            elif parameter == 3:
-                self._R_offset = offset
-                self._R_expand = expand
+            self._output_offset_expands[parameter] = (offset, expand)
         else:
             raise ValueError(
                 f"Invalid parameter, offset, or expand: {parameter}, {offset}, or "
@@ -1233,12 +1290,8 @@ class sr830:
                 * 1 : 10
                 * 2 : 100
         """
-        if parameter == 1:
-            return self._X_offset, self._X_expand
-        elif parameter == 2:
-            return self._Y_offset, self._Y_expand
-        elif parameter == 3:
-            return self._R_offset, self._R_expand
+        if parameter in self._output_offset_expands:
+            return self._output_offset_expands[parameter]
         else:
             raise ValueError(
                 f"Invalid paramter: {parameter}. Must be 1 (X), 2 (Y), or 3 (R)."
@@ -1256,12 +1309,9 @@ class sr830:
                 * 2 : Y
                 * 3 : R
         """
-        if parameter == 1:
-            self._X_offset = 0
-        elif parameter == 2:
-            self._Y_offset = 0
-        elif parameter == 3:
-            self._R_offset = 0
+        if parameter in self._output_offset_expands:
+            _, expand = self._output_offset_expands[parameter]
+            self._output_offset_expands[parameter] = (0, expand)
         else:
             raise ValueError(
                 f"Invalid paramter: {parameter}. Must be 1 (X), 2 (Y), or 3 (R)."
@@ -1303,14 +1353,7 @@ class sr830:
             Output voltage, -10.500 =< voltage =< 10.500
         """
         if (aux_out in [1, 2, 3, 4]) and (voltage >= -10.5) and (voltage <= 10.5):
-            if aux_out == 1:
-                self._aux_out_1 = voltage
-            elif aux_out == 2:
-                self._aux_out_2 = voltage
-            elif aux_out == 3:
-                self._aux_out_3 = voltage
-            elif aux_out == 4:
-                self._aux_out_4 = voltage
+            self._aux_outs[aux_out] = voltage
         else:
             raise ValueError(
                 f"Invalid auxilliary output or voltage: {aux_out} or {voltage}. Aux "
@@ -1331,14 +1374,8 @@ class sr830:
         voltage : float
             Output voltage, -10.500 =< voltage =< 10.500
         """
-        if aux_out == 1:
-            return self._aux_out_1
-        elif aux_out == 2:
-            return self._aux_out_2
-        elif aux_out == 3:
-            return self._aux_out_3
-        elif aux_out == 4:
-            return self._aux_out_4
+        if aux_out in self._aux_outs:
+            return self._aux_outs[aux_out]
         else:
             raise ValueError(
                 f"Invalid auxilliary output: {aux_out}. Must be an integer in range "
@@ -1607,7 +1644,9 @@ class sr830:
         Ignored if storage already in progress.
 
         After turning on fast data transfer, this function starts the scan after a
-        delay of 0.5 sec.
+        delay of 0.5 sec. The delay is applied by the instrument so the controlling
+        interface has time to start reading before the first points are sent, so
+        start reading immediately after calling this function rather than waiting.
         """
         # TODO: implement dummy store in buffer
         pass
@@ -1633,6 +1672,10 @@ class sr830:
     def measure(self, parameter):
         """Read the value of X, Y, R, or phase.
 
+        Each call is a separate bus transaction. To read more than one value use
+        `measure_xy()`, `measure_rphi()`, or `measure_multiple()` instead, which read
+        all values in a single transaction at the same instant.
+
         Parameters
         ----------
         parameter : {1, 2, 3, 4}
@@ -1656,6 +1699,36 @@ class sr830:
                 + "(phase)."
             )
 
+    def measure_xy(self):
+        """Read the values of X and Y simultaneously.
+
+        Both values are recorded at a single instant and read in a single bus
+        transaction.
+
+        Returns
+        -------
+        x : float
+            Value of X in volts.
+        y : float
+            Value of Y in volts.
+        """
+        return 1.0, 1.0
+
+    def measure_rphi(self):
+        """Read the values of R and phase simultaneously.
+
+        Both values are recorded at a single instant and read in a single bus
+        transaction.
+
+        Returns
+        -------
+        r : float
+            Value of R in volts.
+        phase : float
+            Value of phase in degrees.
+        """
+        return 1.0, 1.0
+
     def read_display(self, channel):
         """Read the value of a channel display.
 
@@ -1675,9 +1748,9 @@ class sr830:
         if channel in [1, 2]:
             return 1.0
         else:
-            raise ValueError(f"Invalid channel: {channel}. Must be 0 (Ch1) or 1 (Ch2).")
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
 
-    def measure_multiple(self, parameters):
+    def measure_multiple(self, parameters, as_tuple=False):
         """Read multiple (2-6) parameter values simultaneously.
 
         The values of X and Y are recorded at a single instant.
@@ -1709,15 +1782,21 @@ class sr830:
                 * 10 : CH1 display
                 * 11 : CH2 display
 
+        as_tuple : bool, optional
+            If `True`, return the values as a tuple of float instead of an array.
+
         Returns
         -------
-        values : tuple of float
+        values : numpy.ndarray of float64 or tuple of float
             Values of measured parameters.
         """
         if all(p in range(1, 12) for p in parameters) and (
             len(parameters) in range(2, 7)
         ):
-            return (1.0 for i in parameters)
+            values = np.ones(len(parameters))
+            if as_tuple is True:
+                return tuple(values.tolist())
+            return values
         else:
             raise ValueError(
                 f"Invalid parameter list: {parameters}. All paramters must be integers"
@@ -1736,7 +1815,7 @@ class sr830:
         """
         return self._buffer_size
 
-    def get_ascii_buffer_data(self, channel, start_bin, bins):
+    def get_ascii_buffer_data(self, channel, start_bin, bins, as_tuple=False):
         """Get the points stored in a channel buffer range.
 
         The values are returned as ASCII floating point numbers with
@@ -1757,18 +1836,23 @@ class sr830:
             Starting bin to read where 0 is oldest. Must be in range 0 - 16382.
         bins : int
             Number of bins to read. Must be in range 1 - 16383.
+        as_tuple : bool, optional
+            If `True`, return the data as a tuple of float instead of an array.
 
         Returns
         -------
-        buffer : tuple of float
+        buffer : numpy.ndarray of float32 or tuple of float
             Data stored in buffer range.
         """
         if (
-            (channel in range(3))
+            (channel in [1, 2])
             and (start_bin in range(16383))
             and (bins in range(1, 16384))
         ):
-            return tuple([1.0 for x in range(bins)])
+            buffer = np.ones(bins, dtype=np.float32)
+            if as_tuple is True:
+                buffer = tuple(buffer.tolist())
+            return buffer
         else:
             raise ValueError(
                 f"Invalid channel, start bin or bins: {channel}, {start_bin}, or "
@@ -1776,11 +1860,12 @@ class sr830:
                 + "range 0 - 16382; and bins must be in range 1 - 16383."
             )
 
-    def get_binary_buffer_data(self, channel, start_bin, bins):
+    def get_binary_buffer_data(self, channel, start_bin, bins, as_tuple=False):
         """Get the points stored in a channel buffer range.
 
-        The values are returned as IEEE format binary floating point
-        numbers with the units of the trace.
+        The values are transferred as IEEE format binary floating point
+        numbers with the units of the trace and read directly into a
+        single-precision NumPy array.
 
         Bins (or points) a labelled from 0 (oldest) to N-1 (newest)
         where N is the total number of bins.
@@ -1797,20 +1882,23 @@ class sr830:
             Starting bin to read where 0 is oldest. Must be in range 0 - 16382.
         bins : int
             Number of bins to read. Must be in range 1 - 16383.
+        as_tuple : bool, optional
+            If `True`, return the data as a tuple of float instead of an array.
 
         Returns
         -------
-        buffer : tuple of float
+        buffer : numpy.ndarray of float32 or tuple of float
             Data stored in buffer range.
         """
         if (
             (channel in [1, 2])
-            and (start_bin >= 0)
-            and (start_bin <= 16382)
-            and (bins >= 1)
-            and (bins <= 16383)
+            and (start_bin in range(16383))
+            and (bins in range(1, 16384))
         ):
-            return tuple([1.0 for x in range(bins)])
+            buffer = np.ones(bins, dtype=np.float32)
+            if as_tuple is True:
+                buffer = tuple(buffer.tolist())
+            return buffer
         else:
             raise ValueError(
                 f"Invalid channel, start bin or bins: {channel}, {start_bin}, or "
@@ -1818,19 +1906,19 @@ class sr830:
                 + "range 0 - 16382; and bins must be in range 1 - 16383."
             )
 
-    def get_non_norm_buffer_data(self, channel, start_bin, bins):
+    def get_non_norm_buffer_data(self, channel, start_bin, bins, as_tuple=False):
         """Get the points stored in a channel buffer range.
 
-        The values are returned as non-normalised floating point
-        numbers with the units of the trace.
+        The values are transferred as non-normalised floating point
+        numbers with the units of the trace and decoded into a
+        single-precision NumPy array.
 
         Bins (or points) a labelled from 0 (oldest) to N-1 (newest)
         where N is the total number of bins.
 
-        If data storage is set to Loop mode, make sure that
-        storage is paused before reading any data. This is because
-        the points are indexed relative to the most recent point
-        which is continually changing.
+        If data storage is set to Loop mode, storage is paused before
+        reading any data. This is because the points are indexed relative
+        to the most recent point which is continually changing.
 
         Parameters
         ----------
@@ -1840,20 +1928,23 @@ class sr830:
             Starting bin to read where 0 is oldest. Must be in range 0 - 16382.
         bins : int
             Number of bins to read. Must be in range 1 - 16383.
+        as_tuple : bool, optional
+            If `True`, return the data as a tuple of float instead of an array.
 
         Returns
         -------
-        buffer : tuple of float
+        buffer : numpy.ndarray of float32 or tuple of float
             Data stored in buffer range.
         """
         if (
             (channel in [1, 2])
-            and (start_bin >= 0)
-            and (start_bin <= 16382)
-            and (bins >= 1)
-            and (bins <= 16383)
+            and (start_bin in range(16383))
+            and (bins in range(1, 16384))
         ):
-            return tuple([1.0 for x in range(bins)])
+            buffer = np.ones(bins, dtype=np.float32)
+            if as_tuple is True:
+                buffer = tuple(buffer.tolist())
+            return buffer
         else:
             raise ValueError(
                 f"Invalid channel, start bin or bins: {channel}, {start_bin}, or "
@@ -1861,6 +1952,69 @@ class sr830:
                 + "range 0 - 16382; and bins must be in range 1 - 16383."
             )
 
+    def get_all_buffer_data(self, channel):
+        """Get all points stored in a channel buffer.
+
+        The number of stored points is read once and all of them are read in a
+        single binary transfer, which is much faster than reading a growing buffer
+        in many small ranges. The transfer is as for `get_binary_buffer_data()`.
+
+        Parameters
+        ----------
+        channel : {1, 2}
+            Channel 1 or 2.
+
+        Returns
+        -------
+        buffer : numpy.ndarray of float32
+            Data stored in the buffer, oldest first. Empty if no points are stored.
+        """
+        if channel in [1, 2]:
+            return np.ones(self._buffer_size, dtype=np.float32)
+        else:
+            raise ValueError(f"Invalid channel: {channel}. Must be 1 (Ch1) or 2 (Ch2).")
+
+    def stream_buffer(self, channel, chunk=1024, points=None):
+        """Yield channel buffer data in chunks while data storage is in progress.
+
+        A background thread polls the number of stored points and reads each
+        completed chunk using a binary transfer, so reading earlier data overlaps
+        with the instrument storing new data. Storage should be started in 1 Shot
+        end of buffer mode, e.g. with `start()`, before iterating. Loop mode is not
+        supported because points are indexed relative to the most recent point.
+
+        The instrument must not be accessed from other code while the generator is
+        running. Streaming stops when `points` points have been read, the buffer is
+        full, or data storage stops and all stored points have been read.
+
+        Parameters
+        ----------
+        channel : {1, 2}
+            Channel 1 or 2.
+        chunk : int, optional
+            Number of points to read per transfer while storage is in progress.
+        points : int or None, optional
+            Total number of points to read. If `None`, read until the buffer is full
+            or storage stops.
+
+        Yields
+        ------
+        buffer : numpy.ndarray of float32
+            Chunk of data stored in the buffer.
+        """
+        if (channel in [1, 2]) and (chunk >= 1) and ((points is None) or (points >= 1)):
+            remaining = self._buffer_size if points is None else min(points, 16383)
+            while remaining > 0:
+                bins = min(chunk, remaining)
+                remaining -= bins
+                yield np.ones(bins, dtype=np.float32)
+        else:
+            raise ValueError(
+                f"Invalid channel, chunk, or points: {channel}, {chunk}, or {points}. "
+                + "Channel must be 1 (Ch1) or 2 (Ch2); chunk must be at least 1; and "
+                + "points must be None or at least 1."
+            )
+
     @property
     def data_transfer_mode(self):
         """Get the data transfer mode.
@@ -1901,8 +2055,16 @@ class sr830:
 
     # --- Interface commands ---
 
-    def reset(self):
-        """Reset the instrument to the default configuration."""
+    def reset(self, force=True):
+        """Reset the instrument to the default configuration.
+
+        Parameters
+        ----------
+        force : bool, optional
+            If `False`, only reset the instrument if commands have been written since
+            the last reset by this object. Changes made by other means, e.g. from the
+            front panel, aren't tracked so only use this if they can't happen.
+        """
         self._set_dummy_properties()
 
     @property
@@ -1915,9 +2077,9 @@ class sr830:
 
         Returns
         -------
-        idn : list
-            List of identification strings consisting of manufacturer, model, serial
-            number, and firmware version number in order.
+        idn : str
+            Comma separated identification string consisting of manufacturer, model,
+            serial number, and firmware version number in order.
         """
         return self._idn
 
@@ -2020,8 +2182,24 @@ class sr830:
             Specific bit to set with a binary value.
         """
         if register in (registers := self._enable_register_cmd_dict.keys()):
-            # TODO: make dummy variables
-            pass
+            if decimal is True:
+                if value in range(256):
+                    self._enable_registers[register] = value
+                else:
+                    raise ValueError(
+                        f"Invalid value: {value}. Must be in range 0 - 255 if decimal."
+                    )
+            else:
+                if (bit in range(8)) and (value in (0, 1)):
+                    if value == 1:
+                        self._enable_registers[register] |= 1 << bit
+                    else:
+                        self._enable_registers[register] &= ~(1 << bit)
+                else:
+                    raise ValueError(
+                        f"Invalud bit or value: {bit} or {value}. Bit must in range"
+                        + " 0 - 7 and value must be 0 or 1 if value is not decimal."
+                    )
         else:
             raise ValueError(
                 f"Invalid register: {register}. Must be one of "
@@ -2044,8 +2222,15 @@ class sr830:
             Register value.
         """
         if register in (registers := self._enable_register_cmd_dict.keys()):
-            # TODO: make dummy variables
-            pass
+            value = self._enable_registers[register]
+            if bit is None:
+                return value
+            elif bit in range(8):
+                return (value >> bit) & 1
+            else:
+                raise ValueError(
+                    f"{bit} is out of range. Bit must be in range 0-7 if specified."
+                )
         else:
             raise ValueError(
                 f"Invalid register: {register}. Must be one of "
@@ -2078,6 +2263,30 @@ class sr830:
                 + f"{', '.join(list(status_bytes))}."
             )
 
+    def status_snapshot(self):
+        """Get all status bytes with a single compound query.
+
+        Reading the standard event, error, and LIA status bytes clears them.
+
+        Returns
+        -------
+        status_bytes : dict of int
+            Status byte values keyed by "standard_event", "serial_poll", "error",
+            and "lia_status".
+        """
+        return {status_byte: 0 for status_byte in self._status_byte_cmd_dict}
+
+    def enable_register_snapshot(self):
+        """Get all enable registers with a single compound query.
+
+        Returns
+        -------
+        enable_registers : dict of int
+            Enable register values keyed by "standard_event", "serial_poll", "error",
+            and "lia_status".
+        """
+        return dict(self._enable_registers)
+
     @property
     def power_on_status_clear_bit(self):
         """Get the power-on status clear bit.